@@ -4,13 +4,13 @@ Agent Registry - Fusion v13.0
 Central registry for all Fusion agents
 """
 
-from .creative_director_agent import CreativeDirectorAgent
-from .prompt_master_agent import PromptMasterAgent
+import importlib
 
-# Core Fusion v13.0 Agents
+# Core Fusion v13.0 Agents. A "module:Class" string is imported and
+# instantiated by get_agent on first use, then replaced by the instance
 AGENTS = {
-    "creative_director": CreativeDirectorAgent(),
-    "prompt_master": PromptMasterAgent(),
+    "creative_director": ".creative_director_agent:CreativeDirectorAgent",
+    "prompt_master": ".prompt_master_agent:PromptMasterAgent",
     "strategy_pilot": None,  # Placeholder for future implementation
     "vp_of_product": None,   # Placeholder for future implementation
     "vp_of_design": None,    # Placeholder for future implementation
@@ -21,7 +21,12 @@ AGENTS = {
 
 def get_agent(agent_name: str):
     """Get an agent by name"""
-    return AGENTS.get(agent_name)
+    agent = AGENTS.get(agent_name)
+    if isinstance(agent, str):
+        module_name, class_name = agent.split(":")
+        module = importlib.import_module(module_name, package=__package__)
+        agent = AGENTS[agent_name] = getattr(module, class_name)()
+    return agent
 
 def list_agents():
     """List all available agents"""
@@ -34,7 +39,6 @@ def register_agent(name: str, agent_instance):
 def discover_agents():
     """Auto-discover agents from agents/ directory"""
     import os
-    import importlib
     
     agents_dir = os.path.dirname(__file__)
     discovered = []
@@ -44,12 +48,15 @@ def discover_agents():
             module_name = filename[:-3]  # Remove .py
             try:
                 module = importlib.import_module(f'.{module_name}', package='agents')
-                if hasattr(module, module_name.replace('_', '').title() + 'Agent'):
-                    agent_class = getattr(module, module_name.replace('_', '').title() + 'Agent')
-                    agent_instance = agent_class()
-                    register_agent(module_name, agent_instance)
-                    discovered.append(module_name)
-                    print(f"✅ Discovered agent: {module_name}")
+                # creative_director_agent -> CreativeDirectorAgent
+                class_name = ''.join(part.capitalize() for part in module_name[:-len('_agent')].split('_')) + 'Agent'
+                agent_class = getattr(module, class_name, None)
+                if agent_class is None:
+                    continue
+                agent_instance = agent_class()
+                register_agent(module_name, agent_instance)
+                discovered.append(module_name)
+                print(f"✅ Discovered agent: {module_name}")
             except Exception as e:
                 print(f"⚠️ Failed to load agent {module_name}: {e}")
     
@@ -5,11 +5,332 @@ Handles Figma-to-code fidelity, token extraction, Tailwind/React mapping
 """
 
 import asyncio
+import hashlib
 import time
 import logging
+import math
 import re
-from typing import Dict, Any, List, Optional
-from datetime import datetime
+from collections import OrderedDict
+from itertools import chain
+from typing import Dict, Any, FrozenSet, List, Optional, Tuple
+
+from .result_copy import copy_result
+
+# Number of prompt analyses kept by DesignTechnologistAgent._cached_analysis
+_RESULT_CACHE_SIZE = 256
+
+# Component types in detection order, each with the keywords that select it
+_COMPONENT_TYPE_KEYWORDS = (
+    ("button", ("button", "btn")),
+    ("card", ("card", "tile")),
+    ("form", ("form", "input")),
+    ("modal", ("modal", "dialog")),
+    ("navigation", ("navigation", "nav")),
+    ("dashboard", ("dashboard", "layout"))
+)
+
+# Design patterns and technical requirements, each with its trigger keywords
+_DESIGN_PATTERN_KEYWORDS = (
+    ("responsive_design", ("responsive", "mobile")),
+    ("theme_support", ("dark", "theme")),
+    ("animations", ("animation", "transition")),
+    ("layout_system", ("grid", "flex"))
+)
+_TECHNICAL_REQUIREMENT_KEYWORDS = (
+    ("tailwind_css", ("tailwind",)),
+    ("react_components", ("react",)),
+    ("accessibility", ("accessibility", "a11y")),
+    ("responsive_design", ("responsive",))
+)
+
+# Framework keywords in preference order; Tailwind CSS is the default
+_FRAMEWORK_KEYWORDS = (("tailwind", "Tailwind CSS"), ("react", "React"), ("vue", "Vue.js"))
+
+# Design token vocabularies, matched case-sensitively against the prompt
+_COLOR_KEYWORDS = ("blue", "red", "green", "yellow", "purple", "gray", "white", "black")
+_SEMANTIC_COLORS = ("primary", "secondary", "accent", "success", "warning", "error")
+_FONT_SIZES = ("xs", "sm", "base", "lg", "xl", "2xl", "3xl")
+_FONT_WEIGHTS = ("light", "normal", "medium", "semibold", "bold")
+_SPACING_VALUES = ("xs", "sm", "md", "lg", "xl")
+_LAYOUT_PATTERNS = ("flex", "grid", "block", "inline")
+
+# Literal values extracted alongside the vocabularies: six-digit hex colors
+# (captured without the "#") and pixel lengths such as 16px or 1.5px, never
+# starting partway through a number
+_HEX_COLOR_RE = re.compile(r"#([0-9a-fA-F]{6})\b")
+_PIXEL_VALUE_RE = re.compile(r"(?<![\w.])\d+(?:\.\d+)?px\b")
+_HEX_TOKEN_PREFIX = "color_hex_"
+
+# Design token categories
+_TOKEN_CATEGORIES = {
+    "colors": ["primary", "secondary", "accent", "neutral", "success", "warning", "error"],
+    "typography": ["font_family", "font_size", "font_weight", "line_height", "letter_spacing"],
+    "spacing": ["padding", "margin", "gap", "border_radius", "shadow"],
+    "layout": ["width", "height", "flex", "grid", "position"],
+    "interaction": ["hover", "focus", "active", "disabled", "transition"]
+}
+
+# Tailwind utility mappings
+_TAILWIND_MAPPINGS = {
+    "colors": {
+        "primary": "bg-blue-500 text-white",
+        "secondary": "bg-gray-500 text-white", 
+        "accent": "bg-purple-500 text-white",
+        "success": "bg-green-500 text-white",
+        "warning": "bg-yellow-500 text-black",
+        "error": "bg-red-500 text-white"
+    },
+    "spacing": {
+        "xs": "p-1 m-1",
+        "sm": "p-2 m-2", 
+        "md": "p-4 m-4",
+        "lg": "p-6 m-6",
+        "xl": "p-8 m-8"
+    },
+    "typography": {
+        "heading": "text-2xl font-bold",
+        "subheading": "text-xl font-semibold",
+        "body": "text-base font-normal",
+        "caption": "text-sm font-light"
+    }
+}
+
+# Component complexity levels
+_COMPLEXITY_LEVELS = {
+    "simple": {"score": 1, "description": "Basic layout with standard components"},
+    "moderate": {"score": 2, "description": "Interactive elements with state management"},
+    "complex": {"score": 3, "description": "Advanced interactions with custom logic"},
+    "expert": {"score": 4, "description": "Highly customized with complex animations"}
+}
+
+# Accessibility requirements
+_ACCESSIBILITY_REQUIREMENTS = [
+    "semantic_html",
+    "aria_labels", 
+    "keyboard_navigation",
+    "color_contrast",
+    "focus_indicators",
+    "screen_reader_support"
+]
+
+# Token coverage for 0..10 tokens and complexity score for 0..6 factors,
+# computed with the original formulas so every value is bit-identical
+_TOKEN_COVERAGE = tuple(min(count / 10.0, 1.0) for count in range(11))
+_COMPLEXITY_SCORES = tuple(min(count * 0.5, 3.0) for count in range(7))
+
+# Complexity level and development effort per score band: up to 1, up to 2,
+# up to 3, above 3
+_COMPLEXITY_LEVEL_NAMES = ("simple", "moderate", "complex", "expert")
+_DEVELOPMENT_EFFORTS = ("1-2 hours", "2-4 hours", "4-8 hours", "8+ hours")
+
+def _score_band(score: float) -> int:
+    """Index of the band a complexity score falls in"""
+    return min(max(math.ceil(score), 1), 4) - 1
+
+# Accessibility requirements every component gets, and the implementation
+# guideline for each requirement
+_BASIC_ACCESSIBILITY_REQUIREMENTS = ("semantic_html", "aria_labels", "keyboard_navigation")
+_ACCESSIBILITY_GUIDELINES = {
+    "semantic_html": "• Use semantic HTML elements (button, nav, main, etc.)",
+    "aria_labels": "• Add appropriate ARIA labels and roles",
+    "keyboard_navigation": "• Ensure keyboard navigation works properly",
+    "color_contrast": "• Maintain sufficient color contrast ratios",
+    "focus_indicators": "• Provide visible focus indicators",
+    "screen_reader_support": "• Test with screen readers"
+}
+
+# Complexity factors, each with its trigger keywords
+_COMPLEXITY_FACTOR_KEYWORDS = (
+    ("interactions", ("hover", "click", "interactive")),
+    ("animations", ("animation", "transition", "motion")),
+    ("state_management", ("state", "form", "validation")),
+    ("accessibility", ("accessibility", "a11y", "aria")),
+    ("responsive_design", ("responsive", "mobile", "tablet"))
+)
+
+# Every keyword probed in the lowercased prompt, and every token vocabulary
+# word probed in the prompt as given
+_KEYWORDS = tuple(dict.fromkeys(
+    [keyword
+     for table in (_COMPONENT_TYPE_KEYWORDS, _DESIGN_PATTERN_KEYWORDS, _TECHNICAL_REQUIREMENT_KEYWORDS,
+                   _COMPLEXITY_FACTOR_KEYWORDS)
+     for _, keywords in table
+     for keyword in keywords]
+    + [keyword for keyword, _ in _FRAMEWORK_KEYWORDS]
+))
+_TOKEN_WORDS = tuple(dict.fromkeys(
+    _COLOR_KEYWORDS + _SEMANTIC_COLORS + _FONT_SIZES + _FONT_WEIGHTS + _SPACING_VALUES + _LAYOUT_PATTERNS
+))
+
+def _compile_scan(words):
+    """Compile a one-pass scan for words: zero-width lookahead so overlapping
+    words are all found, longest first so each position reports its longest
+    match, plus the closure mapping a match to every word it contains"""
+    pattern = re.compile("(?=(%s))" % "|".join(map(re.escape, sorted(words, key=len, reverse=True))))
+    closure = {word: frozenset(w for w in words if w in word) for word in words}
+    return pattern, closure
+
+_KEYWORD_RE, _KEYWORD_CLOSURE = _compile_scan(_KEYWORDS)
+_TOKEN_WORD_RE, _TOKEN_WORD_CLOSURE = _compile_scan(_TOKEN_WORDS)
+
+# Keyword presence is tracked as an int with one bit per keyword, so every
+# keyword predicate is a single bit test against a precomputed mask
+_KEYWORD_BITS = {keyword: 1 << index for index, keyword in enumerate(_KEYWORDS)}
+
+def _keyword_mask(keywords) -> int:
+    """Combine the bits of keywords into one mask"""
+    mask = 0
+    for keyword in keywords:
+        mask |= _KEYWORD_BITS[keyword]
+    return mask
+
+_KEYWORD_MATCH_MASKS = {match: _keyword_mask(keywords) for match, keywords in _KEYWORD_CLOSURE.items()}
+_COMPONENT_TYPE_MASKS = tuple((component_type, _keyword_mask(triggers)) for component_type, triggers in _COMPONENT_TYPE_KEYWORDS)
+_DESIGN_PATTERN_MASKS = tuple((pattern, _keyword_mask(triggers)) for pattern, triggers in _DESIGN_PATTERN_KEYWORDS)
+_TECHNICAL_REQUIREMENT_MASKS = tuple((requirement, _keyword_mask(triggers)) for requirement, triggers in _TECHNICAL_REQUIREMENT_KEYWORDS)
+_FRAMEWORK_MASKS = tuple((_KEYWORD_BITS[keyword], framework) for keyword, framework in _FRAMEWORK_KEYWORDS)
+_COMPLEXITY_FACTOR_MASKS = tuple((factor, _keyword_mask(triggers)) for factor, triggers in _COMPLEXITY_FACTOR_KEYWORDS)
+_KW_ACCESSIBILITY = _KEYWORD_BITS["accessibility"]
+_KW_A11Y = _KEYWORD_BITS["a11y"]
+_KW_RESPONSIVE = _KEYWORD_BITS["responsive"]
+
+# Token extraction of every prompt without a design token (copied per result,
+# with fresh containers), and the code mapping defaults used when there are no tokens
+_NO_TOKEN_EXTRACTION: Dict[str, Any] = {
+    "extracted_tokens": [],
+    "token_categories": {},
+    "token_count": 0,
+    "coverage_score": 0.0
+}
+_DEFAULT_TAILWIND_UTILITIES = "p-4 bg-white rounded-lg"
+_NO_CSS_PROPERTIES = "/* No custom properties needed */"
+
+# Shared read-only default for lookups that may be missing
+_EMPTY: Dict[str, Any] = {}
+
+def _css_block(properties: Tuple[str, ...]) -> str:
+    """CSS custom properties block declaring the given property lines"""
+    return "/* CSS Custom Properties */\n:root {\n" + "\n".join(properties) + "\n}" if properties else _NO_CSS_PROPERTIES
+
+def _css_color_properties(primary: str, secondary: str) -> Tuple[str, str]:
+    """Primary and secondary color property lines for two hex codes (without "#")"""
+    return (f"  --color-primary: #{primary};", f"  --color-secondary: #{secondary};")
+
+# Default primary and secondary colors, replaced in order by extracted hex colors
+_CSS_COLOR_DEFAULTS = ("3b82f6", "6b7280")
+_CSS_COLOR_PROPERTIES = _css_color_properties(*_CSS_COLOR_DEFAULTS)
+_CSS_SPACING_PROPERTIES = ("  --spacing-base: 1rem;", "  --spacing-lg: 1.5rem;")
+
+# Every CSS custom properties block without extracted hex colors, indexed by
+# (has color tokens << 1) | has spacing tokens
+_CSS_PROPERTIES = tuple(
+    _css_block((_CSS_COLOR_PROPERTIES if index & 2 else ()) + (_CSS_SPACING_PROPERTIES if index & 1 else ()))
+    for index in range(4)
+)
+
+# Tailwind utilities for the semantic color tokens that have one
+_COLOR_UTILITIES = {
+    "color_primary": "bg-blue-500 text-white",
+    "color_secondary": "bg-gray-500 text-white",
+    "color_success": "bg-green-500 text-white",
+    "color_warning": "bg-yellow-500 text-black",
+    "color_error": "bg-red-500 text-white"
+}
+
+# React component skeletons by component type, with a generic fallback
+_REACT_STRUCTURES = {
+    "button": """export default function Button({ children, ...props }) {
+  return (
+    <button 
+      className="px-4 py-2 bg-blue-500 text-white rounded-lg hover:bg-blue-600 focus:outline-none focus:ring-2 focus:ring-blue-500"
+      {...props}
+    >
+      {children}
+    </button>
+  );
+}""",
+    "card": """export default function Card({ children, ...props }) {
+  return (
+    <div 
+      className="p-6 bg-white rounded-lg shadow-md border border-gray-200"
+      {...props}
+    >
+      {children}
+    </div>
+  );
+}"""
+}
+_DEFAULT_REACT_STRUCTURE = """export default function Component({ children, ...props }) {
+  return (
+    <div className="p-4 bg-white rounded-lg" {...props}>
+      {children}
+    </div>
+  );
+}"""
+
+# Markdown layout of the technical analysis, filled by DesignTechnologistAgent._flatten_output
+_ENHANCED_OUTPUT_TEMPLATE = """# Design Technologist Analysis & Implementation
+
+## Original Request
+{prompt}
+
+## Design Analysis
+
+### Component Type
+**Type:** {component_type}
+**Patterns:** {design_patterns}
+**Framework:** {framework}
+
+## Token Extraction
+
+### Extracted Tokens ({token_count} total)
+{token_categories}
+
+### Coverage Score
+**Score:** {coverage_score:.2f}/1.00
+
+## Code Implementation
+
+### Tailwind Utilities
+```
+{tailwind_utilities}
+```
+
+### React Component Structure
+```jsx
+{react_structure}
+```
+
+### CSS Custom Properties
+```css
+{css_properties}
+```
+
+## Complexity Assessment
+
+### Level: {complexity_level}
+**Score:** {complexity_score:.1f}/4.0
+**Description:** {complexity_description}
+**Development Effort:** {development_effort}
+
+## Accessibility Recommendations
+
+### Requirements
+{accessibility_requirements}
+
+### Implementation Guidelines
+{accessibility_guidelines}
+
+### Accessibility Score
+**Score:** {accessibility_score:.2f}/1.00
+
+## Implementation Notes
+{implementation_notes}
+
+## Design Technologist Confidence
+**Score:** {confidence:.2f}/1.00
+
+*Generated by Fusion v14 Design Technologist Agent*"""
 
 class DesignTechnologistAgent:
     """
@@ -17,61 +338,21 @@ class DesignTechnologistAgent:
     Handles Figma-to-code fidelity, token extraction, Tailwind/React mapping
     """
     
+    # Only the logger is per instance
+    __slots__ = ("logger",)
+    
+    # Taxonomies are shared by every instance rather than rebuilt per agent
+    token_categories = _TOKEN_CATEGORIES
+    tailwind_mappings = _TAILWIND_MAPPINGS
+    complexity_levels = _COMPLEXITY_LEVELS
+    accessibility_requirements = _ACCESSIBILITY_REQUIREMENTS
+    
+    # Analyses of recent prompts keyed by prompt digest, shared by every instance (LRU order)
+    _result_cache: "OrderedDict[bytes, Dict[str, Any]]" = OrderedDict()
+    
     def __init__(self):
         self.logger = logging.getLogger("DesignTechnologistAgent")
         
-        # Design token categories
-        self.token_categories = {
-            "colors": ["primary", "secondary", "accent", "neutral", "success", "warning", "error"],
-            "typography": ["font_family", "font_size", "font_weight", "line_height", "letter_spacing"],
-            "spacing": ["padding", "margin", "gap", "border_radius", "shadow"],
-            "layout": ["width", "height", "flex", "grid", "position"],
-            "interaction": ["hover", "focus", "active", "disabled", "transition"]
-        }
-        
-        # Tailwind utility mappings
-        self.tailwind_mappings = {
-            "colors": {
-                "primary": "bg-blue-500 text-white",
-                "secondary": "bg-gray-500 text-white", 
-                "accent": "bg-purple-500 text-white",
-                "success": "bg-green-500 text-white",
-                "warning": "bg-yellow-500 text-black",
-                "error": "bg-red-500 text-white"
-            },
-            "spacing": {
-                "xs": "p-1 m-1",
-                "sm": "p-2 m-2", 
-                "md": "p-4 m-4",
-                "lg": "p-6 m-6",
-                "xl": "p-8 m-8"
-            },
-            "typography": {
-                "heading": "text-2xl font-bold",
-                "subheading": "text-xl font-semibold",
-                "body": "text-base font-normal",
-                "caption": "text-sm font-light"
-            }
-        }
-        
-        # Component complexity levels
-        self.complexity_levels = {
-            "simple": {"score": 1, "description": "Basic layout with standard components"},
-            "moderate": {"score": 2, "description": "Interactive elements with state management"},
-            "complex": {"score": 3, "description": "Advanced interactions with custom logic"},
-            "expert": {"score": 4, "description": "Highly customized with complex animations"}
-        }
-        
-        # Accessibility requirements
-        self.accessibility_requirements = [
-            "semantic_html",
-            "aria_labels", 
-            "keyboard_navigation",
-            "color_contrast",
-            "focus_indicators",
-            "screen_reader_support"
-        ]
-        
     async def run_async(self, prompt: str, context: Dict[str, Any]) -> Dict[str, Any]:
         """
         Main async execution method for Design Technologist Agent
@@ -80,45 +361,18 @@ class DesignTechnologistAgent:
         self.logger.info("Design Technologist Agent starting analysis")
         
         try:
-            # Analyze design requirements
-            design_analysis = await self._analyze_design_requirements(prompt)
-            
-            # Extract design tokens
-            token_extraction = await self._extract_design_tokens(prompt, design_analysis)
-            
-            # Generate Tailwind/React mapping
-            code_mapping = await self._generate_code_mapping(prompt, token_extraction)
-            
-            # Assess component complexity
-            complexity_assessment = await self._assess_component_complexity(prompt, design_analysis)
-            
-            # Generate accessibility recommendations
-            accessibility_recommendations = await self._generate_accessibility_recommendations(prompt, design_analysis)
-            
-            # Create enhanced output
-            enhanced_output = await self._create_enhanced_output(prompt, design_analysis, token_extraction, code_mapping, complexity_assessment, accessibility_recommendations)
+            analysis = self._cached_analysis(prompt)
             
             execution_time = time.time() - start_time
-            confidence = self._calculate_confidence(design_analysis, token_extraction, complexity_assessment)
             
             self.logger.info(f"Design Technologist Agent completed in {execution_time:.2f}s")
             
             return {
-                "output": enhanced_output,
-                "enhanced_output": enhanced_output,
-                "confidence": confidence,
-                "design_analysis": design_analysis,
-                "token_extraction": token_extraction,
-                "code_mapping": code_mapping,
-                "complexity_assessment": complexity_assessment,
-                "accessibility_recommendations": accessibility_recommendations,
+                **analysis,
                 "execution_time": execution_time,
                 "shared_state": {
-                    "component_type": design_analysis.get("component_type"),
-                    "complexity_level": complexity_assessment.get("level"),
-                    "token_count": len(token_extraction.get("extracted_tokens", [])),
-                    "accessibility_score": accessibility_recommendations.get("score"),
-                    "analysis_timestamp": datetime.now().timestamp()
+                    **analysis["shared_state"],
+                    "analysis_timestamp": time.time()
                 }
             }
             
@@ -131,56 +385,113 @@ class DesignTechnologistAgent:
                 "execution_time": execution_time
             }
     
-    async def _analyze_design_requirements(self, prompt: str) -> Dict[str, Any]:
-        """Analyze design requirements from prompt"""
+    def _cached_analysis(self, prompt: str) -> Dict[str, Any]:
+        """Return the analysis for a prompt, reusing the result of an identical earlier prompt.
+        Each caller gets its own copy, so the cached analysis is never handed out"""
+        key = hashlib.blake2b(prompt.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+        cache = DesignTechnologistAgent._result_cache
+        
+        analysis = cache.get(key)
+        if analysis is None:
+            analysis = self._analyze(prompt)
+            cache[key] = analysis
+            if len(cache) > _RESULT_CACHE_SIZE:
+                cache.popitem(last=False)
+        else:
+            cache.move_to_end(key)
+        return copy_result(analysis)
+    
+    def _analyze(self, prompt: str) -> Dict[str, Any]:
+        """Run the full analysis pipeline; everything except timing depends only on the prompt"""
+        
+        # One scan each for the keywords and the design token words in the prompt
+        keyword_mask = self._match_keywords(prompt)
+        token_words = self._match_token_words(prompt)
+        
+        # Analyze design requirements
+        design_analysis = self._analyze_design_requirements(keyword_mask)
+        
+        # Extract design tokens
+        token_extraction = self._extract_design_tokens(prompt, token_words, design_analysis)
+        
+        # Generate Tailwind/React mapping
+        code_mapping = self._generate_code_mapping(keyword_mask, design_analysis, token_extraction)
         
-        prompt_lower = prompt.lower()
+        # Assess component complexity
+        complexity_assessment = self._assess_component_complexity(keyword_mask, design_analysis)
+        
+        # Generate accessibility recommendations
+        accessibility_recommendations = self._generate_accessibility_recommendations(keyword_mask, design_analysis)
+        
+        confidence = self._calculate_confidence(design_analysis, token_extraction, complexity_assessment)
+        
+        # Create enhanced output
+        enhanced_output = self._create_enhanced_output(prompt, design_analysis, token_extraction, code_mapping, complexity_assessment, accessibility_recommendations, confidence)
+        
+        return {
+            "output": enhanced_output,
+            "enhanced_output": enhanced_output,
+            "confidence": confidence,
+            "design_analysis": design_analysis,
+            "token_extraction": token_extraction,
+            "code_mapping": code_mapping,
+            "complexity_assessment": complexity_assessment,
+            "accessibility_recommendations": accessibility_recommendations,
+            "shared_state": {
+                "component_type": design_analysis.get("component_type"),
+                "complexity_level": complexity_assessment.get("level"),
+                "token_count": len(token_extraction.get("extracted_tokens", [])),
+                "accessibility_score": accessibility_recommendations.get("score")
+            }
+        }
+    
+    def _match_keywords(self, prompt: str) -> int:
+        """Return the bitmask of every known keyword contained in the prompt; the only place it is lowercased"""
+        mask = 0
+        for match in set(_KEYWORD_RE.findall(prompt.lower())):
+            mask |= _KEYWORD_MATCH_MASKS[match]
+        return mask
+    
+    def _match_token_words(self, prompt: str) -> FrozenSet[str]:
+        """Return every design token word contained in the prompt, case-sensitively"""
+        matches = set(_TOKEN_WORD_RE.findall(prompt))
+        return frozenset().union(*(_TOKEN_WORD_CLOSURE[match] for match in matches))
+    
+    def _analyze_design_requirements(self, keyword_mask: int) -> Dict[str, Any]:
+        """Analyze design requirements from the prompt keywords"""
         
         # Detect component type
-        component_type = self._detect_component_type(prompt_lower)
+        component_type = self._detect_component_type(keyword_mask)
         
         # Identify design patterns
-        design_patterns = self._identify_design_patterns(prompt_lower)
+        design_patterns = self._identify_design_patterns(keyword_mask)
         
         # Extract technical requirements
-        technical_requirements = self._extract_technical_requirements(prompt_lower)
+        technical_requirements = self._extract_technical_requirements(keyword_mask)
         
         return {
             "component_type": component_type,
             "design_patterns": design_patterns,
             "technical_requirements": technical_requirements,
-            "framework_preferences": self._detect_framework_preferences(prompt_lower)
+            "framework_preferences": self._detect_framework_preferences(keyword_mask)
         }
     
-    async def _extract_design_tokens(self, prompt: str, design_analysis: Dict) -> Dict[str, Any]:
+    def _extract_design_tokens(self, prompt: str, token_words: FrozenSet[str], design_analysis: Dict) -> Dict[str, Any]:
         """Extract design tokens from prompt and analysis"""
         
-        extracted_tokens = []
-        token_categories = {}
-        
-        # Extract color tokens
-        color_tokens = self._extract_color_tokens(prompt)
-        if color_tokens:
-            token_categories["colors"] = color_tokens
-            extracted_tokens.extend(color_tokens)
-        
-        # Extract typography tokens
-        typography_tokens = self._extract_typography_tokens(prompt)
-        if typography_tokens:
-            token_categories["typography"] = typography_tokens
-            extracted_tokens.extend(typography_tokens)
-        
-        # Extract spacing tokens
-        spacing_tokens = self._extract_spacing_tokens(prompt)
-        if spacing_tokens:
-            token_categories["spacing"] = spacing_tokens
-            extracted_tokens.extend(spacing_tokens)
-        
-        # Extract layout tokens
-        layout_tokens = self._extract_layout_tokens(prompt)
-        if layout_tokens:
-            token_categories["layout"] = layout_tokens
-            extracted_tokens.extend(layout_tokens)
+        # No vocabulary word and no room for a hex color or pixel value
+        if not token_words and "#" not in prompt and "px" not in prompt:
+            return dict(_NO_TOKEN_EXTRACTION, extracted_tokens=[], token_categories={})
+        
+        # Group the tokens by category, keeping only non-empty categories
+        categories = (
+            ("colors", self._extract_color_tokens(prompt, token_words)),
+            ("typography", self._extract_typography_tokens(token_words)),
+            ("spacing", self._extract_spacing_tokens(prompt, token_words)),
+            ("layout", self._extract_layout_tokens(token_words))
+        )
+        token_categories = {category: tokens for category, tokens in categories if tokens}
+        extracted_tokens = list(chain.from_iterable(token_categories.values()))
         
         return {
             "extracted_tokens": extracted_tokens,
@@ -189,29 +500,32 @@ class DesignTechnologistAgent:
             "coverage_score": self._calculate_token_coverage(extracted_tokens)
         }
     
-    async def _generate_code_mapping(self, prompt: str, token_extraction: Dict) -> Dict[str, Any]:
+    def _generate_code_mapping(self, keyword_mask: int, design_analysis: Dict, token_extraction: Dict) -> Dict[str, Any]:
         """Generate Tailwind/React code mapping"""
         
-        # Generate Tailwind utilities
-        tailwind_utilities = self._generate_tailwind_utilities(token_extraction)
+        # Generate Tailwind utilities and CSS custom properties; without
+        # tokens both are fixed
+        if token_extraction["token_count"]:
+            tailwind_utilities = self._generate_tailwind_utilities(token_extraction)
+            css_properties = self._generate_css_properties(token_extraction)
+        else:
+            tailwind_utilities = _DEFAULT_TAILWIND_UTILITIES
+            css_properties = _NO_CSS_PROPERTIES
         
         # Generate React component structure
-        react_structure = self._generate_react_structure(prompt, token_extraction)
-        
-        # Generate CSS custom properties
-        css_properties = self._generate_css_properties(token_extraction)
+        react_structure = self._generate_react_structure(design_analysis["component_type"])
         
         return {
             "tailwind_utilities": tailwind_utilities,
             "react_structure": react_structure,
             "css_properties": css_properties,
-            "implementation_notes": self._generate_implementation_notes(prompt, token_extraction)
+            "implementation_notes": self._generate_implementation_notes(keyword_mask, token_extraction)
         }
     
-    async def _assess_component_complexity(self, prompt: str, design_analysis: Dict) -> Dict[str, Any]:
+    def _assess_component_complexity(self, keyword_mask: int, design_analysis: Dict) -> Dict[str, Any]:
         """Assess component complexity"""
         
-        complexity_factors = self._analyze_complexity_factors(prompt, design_analysis)
+        complexity_factors = self._analyze_complexity_factors(keyword_mask, design_analysis)
         complexity_score = self._calculate_complexity_score(complexity_factors)
         complexity_level = self._determine_complexity_level(complexity_score)
         
@@ -219,15 +533,15 @@ class DesignTechnologistAgent:
             "level": complexity_level,
             "score": complexity_score,
             "factors": complexity_factors,
-            "description": self.complexity_levels[complexity_level]["description"],
+            "description": _COMPLEXITY_LEVELS[complexity_level]["description"],
             "development_effort": self._estimate_development_effort(complexity_score)
         }
     
-    async def _generate_accessibility_recommendations(self, prompt: str, design_analysis: Dict) -> Dict[str, Any]:
+    def _generate_accessibility_recommendations(self, keyword_mask: int, design_analysis: Dict) -> Dict[str, Any]:
         """Generate accessibility recommendations"""
         
         # Identify accessibility requirements
-        accessibility_requirements = self._identify_accessibility_requirements(prompt, design_analysis)
+        accessibility_requirements = self._identify_accessibility_requirements(keyword_mask, design_analysis)
         
         # Generate implementation guidelines
         implementation_guidelines = self._generate_accessibility_guidelines(accessibility_requirements)
@@ -242,223 +556,99 @@ class DesignTechnologistAgent:
             "priority_items": self._identify_priority_accessibility_items(accessibility_requirements)
         }
     
-    async def _create_enhanced_output(self, prompt: str, design_analysis: Dict, token_extraction: Dict, code_mapping: Dict, complexity_assessment: Dict, accessibility_recommendations: Dict) -> str:
+    def _create_enhanced_output(self, prompt: str, design_analysis: Dict, token_extraction: Dict, code_mapping: Dict, complexity_assessment: Dict, accessibility_recommendations: Dict, confidence: float) -> str:
         """Create enhanced output with technical analysis"""
         
-        return f"""# Design Technologist Analysis & Implementation
-
-## Original Request
-{prompt}
-
-## Design Analysis
-
-### Component Type
-**Type:** {design_analysis.get('component_type', 'unknown')}
-**Patterns:** {', '.join(design_analysis.get('design_patterns', ['None detected']))}
-**Framework:** {design_analysis.get('framework_preferences', 'Tailwind CSS')}
-
-## Token Extraction
-
-### Extracted Tokens ({token_extraction.get('token_count', 0)} total)
-{self._format_token_categories(token_extraction.get('token_categories', {}))}
-
-### Coverage Score
-**Score:** {token_extraction.get('coverage_score', 0):.2f}/1.00
-
-## Code Implementation
-
-### Tailwind Utilities
-```
-{code_mapping.get('tailwind_utilities', 'No utilities generated')}
-```
-
-### React Component Structure
-```jsx
-{code_mapping.get('react_structure', '// Component structure not generated')}
-```
-
-### CSS Custom Properties
-```css
-{code_mapping.get('css_properties', '/* No custom properties */')}
-```
-
-## Complexity Assessment
-
-### Level: {complexity_assessment.get('level', 'unknown').upper()}
-**Score:** {complexity_assessment.get('score', 0):.1f}/4.0
-**Description:** {complexity_assessment.get('description', 'No description available')}
-**Development Effort:** {complexity_assessment.get('development_effort', 'Unknown')}
-
-## Accessibility Recommendations
-
-### Requirements
-{self._format_accessibility_requirements(accessibility_recommendations.get('requirements', []))}
-
-### Implementation Guidelines
-{self._format_implementation_guidelines(accessibility_recommendations.get('guidelines', []))}
-
-### Accessibility Score
-**Score:** {accessibility_recommendations.get('score', 0):.2f}/1.00
-
-## Implementation Notes
-{code_mapping.get('implementation_notes', 'No specific notes')}
-
-## Design Technologist Confidence
-**Score:** {self._calculate_confidence(design_analysis, token_extraction, complexity_assessment):.2f}/1.00
-
-*Generated by Fusion v14 Design Technologist Agent*"""
-    
-    def _detect_component_type(self, prompt: str) -> str:
-        """Detect component type from prompt"""
-        if "button" in prompt or "btn" in prompt:
-            return "button"
-        elif "card" in prompt or "tile" in prompt:
-            return "card"
-        elif "form" in prompt or "input" in prompt:
-            return "form"
-        elif "modal" in prompt or "dialog" in prompt:
-            return "modal"
-        elif "navigation" in prompt or "nav" in prompt:
-            return "navigation"
-        elif "dashboard" in prompt or "layout" in prompt:
-            return "dashboard"
-        else:
-            return "custom"
+        return _ENHANCED_OUTPUT_TEMPLATE.format_map(self._flatten_output(
+            prompt, design_analysis, token_extraction, code_mapping, complexity_assessment, accessibility_recommendations, confidence
+        ))
     
-    def _identify_design_patterns(self, prompt: str) -> List[str]:
-        """Identify design patterns in prompt"""
-        patterns = []
-        
-        if "responsive" in prompt or "mobile" in prompt:
-            patterns.append("responsive_design")
-        
-        if "dark" in prompt or "theme" in prompt:
-            patterns.append("theme_support")
-        
-        if "animation" in prompt or "transition" in prompt:
-            patterns.append("animations")
-        
-        if "grid" in prompt or "flex" in prompt:
-            patterns.append("layout_system")
-        
-        return patterns
-    
-    def _extract_technical_requirements(self, prompt: str) -> List[str]:
-        """Extract technical requirements"""
-        requirements = []
-        
-        if "tailwind" in prompt:
-            requirements.append("tailwind_css")
-        
-        if "react" in prompt:
-            requirements.append("react_components")
-        
-        if "accessibility" in prompt or "a11y" in prompt:
-            requirements.append("accessibility")
-        
-        if "responsive" in prompt:
-            requirements.append("responsive_design")
+    def _flatten_output(self, prompt: str, design_analysis: Dict, token_extraction: Dict, code_mapping: Dict, complexity_assessment: Dict, accessibility_recommendations: Dict, confidence: float) -> Dict[str, Any]:
+        """Collect every field of the enhanced output template into a flat dict"""
         
-        return requirements
-    
-    def _detect_framework_preferences(self, prompt: str) -> str:
-        """Detect framework preferences"""
-        if "tailwind" in prompt:
-            return "Tailwind CSS"
-        elif "react" in prompt:
-            return "React"
-        elif "vue" in prompt:
-            return "Vue.js"
-        else:
-            return "Tailwind CSS"  # Default
+        return {
+            "prompt": prompt,
+            "component_type": design_analysis.get('component_type', 'unknown'),
+            "design_patterns": ', '.join(design_analysis.get('design_patterns', ['None detected'])),
+            "framework": design_analysis.get('framework_preferences', 'Tailwind CSS'),
+            "token_count": token_extraction.get('token_count', 0),
+            "token_categories": self._format_token_categories(token_extraction.get('token_categories', {})),
+            "coverage_score": token_extraction.get('coverage_score', 0),
+            "tailwind_utilities": code_mapping.get('tailwind_utilities', 'No utilities generated'),
+            "react_structure": code_mapping.get('react_structure', '// Component structure not generated'),
+            "css_properties": code_mapping.get('css_properties', '/* No custom properties */'),
+            "complexity_level": complexity_assessment.get('level', 'unknown').upper(),
+            "complexity_score": complexity_assessment.get('score', 0),
+            "complexity_description": complexity_assessment.get('description', 'No description available'),
+            "development_effort": complexity_assessment.get('development_effort', 'Unknown'),
+            "accessibility_requirements": self._format_accessibility_requirements(accessibility_recommendations.get('requirements', [])),
+            "accessibility_guidelines": self._format_implementation_guidelines(accessibility_recommendations.get('guidelines', [])),
+            "accessibility_score": accessibility_recommendations.get('score', 0),
+            "implementation_notes": code_mapping.get('implementation_notes', 'No specific notes'),
+            "confidence": confidence
+        }
     
-    def _extract_color_tokens(self, prompt: str) -> List[str]:
-        """Extract color tokens from prompt"""
-        colors = []
-        
-        # Extract color names
-        color_keywords = ["blue", "red", "green", "yellow", "purple", "gray", "white", "black"]
-        for color in color_keywords:
-            if color in prompt:
-                colors.append(f"color_{color}")
-        
-        # Extract semantic colors
-        semantic_colors = ["primary", "secondary", "accent", "success", "warning", "error"]
-        for semantic in semantic_colors:
-            if semantic in prompt:
-                colors.append(f"color_{semantic}")
-        
-        return colors
+    def _detect_component_type(self, keyword_mask: int) -> str:
+        """Detect component type from the prompt keywords"""
+        for component_type, triggers in _COMPONENT_TYPE_MASKS:
+            if keyword_mask & triggers:
+                return component_type
+        return "custom"
     
-    def _extract_typography_tokens(self, prompt: str) -> List[str]:
-        """Extract typography tokens from prompt"""
-        typography = []
-        
-        # Extract font sizes
-        font_sizes = ["xs", "sm", "base", "lg", "xl", "2xl", "3xl"]
-        for size in font_sizes:
-            if size in prompt:
-                typography.append(f"font_size_{size}")
-        
-        # Extract font weights
-        font_weights = ["light", "normal", "medium", "semibold", "bold"]
-        for weight in font_weights:
-            if weight in prompt:
-                typography.append(f"font_weight_{weight}")
-        
-        return typography
+    def _identify_design_patterns(self, keyword_mask: int) -> List[str]:
+        """Identify design patterns in the prompt keywords"""
+        return [pattern for pattern, triggers in _DESIGN_PATTERN_MASKS if keyword_mask & triggers]
     
-    def _extract_spacing_tokens(self, prompt: str) -> List[str]:
-        """Extract spacing tokens from prompt"""
-        spacing = []
-        
-        # Extract spacing values
-        spacing_values = ["xs", "sm", "md", "lg", "xl"]
-        for value in spacing_values:
-            if value in prompt:
-                spacing.append(f"spacing_{value}")
-        
-        return spacing
+    def _extract_technical_requirements(self, keyword_mask: int) -> List[str]:
+        """Extract technical requirements"""
+        return [requirement for requirement, triggers in _TECHNICAL_REQUIREMENT_MASKS if keyword_mask & triggers]
     
-    def _extract_layout_tokens(self, prompt: str) -> List[str]:
-        """Extract layout tokens from prompt"""
-        layout = []
-        
-        # Extract layout patterns
-        layout_patterns = ["flex", "grid", "block", "inline"]
-        for pattern in layout_patterns:
-            if pattern in prompt:
-                layout.append(f"layout_{pattern}")
-        
-        return layout
+    def _detect_framework_preferences(self, keyword_mask: int) -> str:
+        """Detect framework preferences"""
+        for trigger, framework in _FRAMEWORK_MASKS:
+            if keyword_mask & trigger:
+                return framework
+        return "Tailwind CSS"  # Default
+    
+    def _extract_color_tokens(self, prompt: str, token_words: FrozenSet[str]) -> List[str]:
+        """Extract color tokens from the prompt's token words and hex color codes"""
+        # Color names, then semantic colors, then each distinct hex code
+        hex_codes = dict.fromkeys(match.lower() for match in _HEX_COLOR_RE.findall(prompt))
+        return ([f"color_{color}" for color in _COLOR_KEYWORDS if color in token_words]
+                + [f"color_{semantic}" for semantic in _SEMANTIC_COLORS if semantic in token_words]
+                + [_HEX_TOKEN_PREFIX + code for code in hex_codes])
+    
+    def _extract_typography_tokens(self, token_words: FrozenSet[str]) -> List[str]:
+        """Extract typography tokens from the prompt's token words"""
+        # Font sizes, then font weights
+        return ([f"font_size_{size}" for size in _FONT_SIZES if size in token_words]
+                + [f"font_weight_{weight}" for weight in _FONT_WEIGHTS if weight in token_words])
+    
+    def _extract_spacing_tokens(self, prompt: str, token_words: FrozenSet[str]) -> List[str]:
+        """Extract spacing tokens from the prompt's token words and pixel values"""
+        # Named spacing values, then each distinct pixel value
+        return ([f"spacing_{value}" for value in _SPACING_VALUES if value in token_words]
+                + [f"spacing_{value}" for value in dict.fromkeys(_PIXEL_VALUE_RE.findall(prompt))])
+    
+    def _extract_layout_tokens(self, token_words: FrozenSet[str]) -> List[str]:
+        """Extract layout tokens from the prompt's token words"""
+        return [f"layout_{pattern}" for pattern in _LAYOUT_PATTERNS if pattern in token_words]
     
     def _calculate_token_coverage(self, tokens: List[str]) -> float:
         """Calculate token coverage score"""
-        if not tokens:
-            return 0.0
-        
-        # Simple coverage calculation
-        base_coverage = min(len(tokens) / 10.0, 1.0)
-        return base_coverage
+        # Simple coverage calculation: a tenth per token, capped at 1.0
+        return _TOKEN_COVERAGE[min(len(tokens), 10)]
     
     def _generate_tailwind_utilities(self, token_extraction: Dict) -> str:
         """Generate Tailwind utilities from tokens"""
+        token_categories = token_extraction.get("token_categories")
+        if not token_categories:
+            return _DEFAULT_TAILWIND_UTILITIES
         utilities = []
-        token_categories = token_extraction.get("token_categories", {})
         
         # Generate color utilities
         if "colors" in token_categories:
-            for color in token_categories["colors"]:
-                if "primary" in color:
-                    utilities.append("bg-blue-500 text-white")
-                elif "secondary" in color:
-                    utilities.append("bg-gray-500 text-white")
-                elif "success" in color:
-                    utilities.append("bg-green-500 text-white")
-                elif "warning" in color:
-                    utilities.append("bg-yellow-500 text-black")
-                elif "error" in color:
-                    utilities.append("bg-red-500 text-white")
+            utilities.extend(_COLOR_UTILITIES[color] for color in token_categories["colors"] if color in _COLOR_UTILITIES)
         
         # Generate spacing utilities
         if "spacing" in token_categories:
@@ -468,168 +658,81 @@ class DesignTechnologistAgent:
         if "typography" in token_categories:
             utilities.append("text-base font-medium")
         
-        return " ".join(utilities) if utilities else "p-4 bg-white rounded-lg"
+        return " ".join(utilities) if utilities else _DEFAULT_TAILWIND_UTILITIES
     
-    def _generate_react_structure(self, prompt: str, token_extraction: Dict) -> str:
+    def _generate_react_structure(self, component_type: str) -> str:
         """Generate React component structure"""
-        component_type = self._detect_component_type(prompt.lower())
-        
-        if component_type == "button":
-            return """export default function Button({ children, ...props }) {
-  return (
-    <button 
-      className="px-4 py-2 bg-blue-500 text-white rounded-lg hover:bg-blue-600 focus:outline-none focus:ring-2 focus:ring-blue-500"
-      {...props}
-    >
-      {children}
-    </button>
-  );
-}"""
-        elif component_type == "card":
-            return """export default function Card({ children, ...props }) {
-  return (
-    <div 
-      className="p-6 bg-white rounded-lg shadow-md border border-gray-200"
-      {...props}
-    >
-      {children}
-    </div>
-  );
-}"""
-        else:
-            return """export default function Component({ children, ...props }) {
-  return (
-    <div className="p-4 bg-white rounded-lg" {...props}>
-      {children}
-    </div>
-  );
-}"""
+        return _REACT_STRUCTURES.get(component_type, _DEFAULT_REACT_STRUCTURE)
     
     def _generate_css_properties(self, token_extraction: Dict) -> str:
         """Generate CSS custom properties"""
-        properties = []
-        token_categories = token_extraction.get("token_categories", {})
-        
-        if "colors" in token_categories:
-            properties.append("  --color-primary: #3b82f6;")
-            properties.append("  --color-secondary: #6b7280;")
-        
+        token_categories = token_extraction.get("token_categories", _EMPTY)
+        colors = token_categories.get("colors", ())
+        hex_codes = [token[len(_HEX_TOKEN_PREFIX):] for token in colors if token.startswith(_HEX_TOKEN_PREFIX)]
+        if not hex_codes:
+            return _CSS_PROPERTIES[bool(colors) << 1 | ("spacing" in token_categories)]
+        
+        # Extracted hex colors fill the primary and secondary slots in prompt order
+        properties = _css_color_properties(*(hex_codes + list(_CSS_COLOR_DEFAULTS[len(hex_codes):]))[:2])
         if "spacing" in token_categories:
-            properties.append("  --spacing-base: 1rem;")
-            properties.append("  --spacing-lg: 1.5rem;")
-        
-        return "/* CSS Custom Properties */\n:root {\n" + "\n".join(properties) + "\n}" if properties else "/* No custom properties needed */"
+            properties += _CSS_SPACING_PROPERTIES
+        return _css_block(properties)
     
-    def _generate_implementation_notes(self, prompt: str, token_extraction: Dict) -> str:
+    def _generate_implementation_notes(self, keyword_mask: int, token_extraction: Dict) -> str:
         """Generate implementation notes"""
         notes = []
         
         if token_extraction.get("token_count", 0) > 5:
             notes.append("• Consider creating a design token system for consistency")
         
-        if "accessibility" in prompt.lower():
+        if keyword_mask & _KW_ACCESSIBILITY:
             notes.append("• Ensure proper ARIA labels and keyboard navigation")
         
-        if "responsive" in prompt.lower():
+        if keyword_mask & _KW_RESPONSIVE:
             notes.append("• Test across different screen sizes and devices")
         
         return "\n".join(notes) if notes else "• Follow standard implementation practices"
     
-    def _analyze_complexity_factors(self, prompt: str, design_analysis: Dict) -> Dict[str, Any]:
+    def _analyze_complexity_factors(self, keyword_mask: int, design_analysis: Dict) -> Dict[str, Any]:
         """Analyze complexity factors"""
-        factors = {
-            "interactions": 0,
-            "animations": 0,
-            "state_management": 0,
-            "accessibility": 0,
-            "responsive_design": 0
-        }
-        
-        prompt_lower = prompt.lower()
-        
-        if any(word in prompt_lower for word in ["hover", "click", "interactive"]):
-            factors["interactions"] = 1
-        
-        if any(word in prompt_lower for word in ["animation", "transition", "motion"]):
-            factors["animations"] = 1
-        
-        if any(word in prompt_lower for word in ["state", "form", "validation"]):
-            factors["state_management"] = 1
-        
-        if any(word in prompt_lower for word in ["accessibility", "a11y", "aria"]):
-            factors["accessibility"] = 1
-        
-        if any(word in prompt_lower for word in ["responsive", "mobile", "tablet"]):
-            factors["responsive_design"] = 1
-        
-        return factors
+        return {factor: int(bool(keyword_mask & triggers)) for factor, triggers in _COMPLEXITY_FACTOR_MASKS}
     
     def _calculate_complexity_score(self, factors: Dict[str, Any]) -> float:
         """Calculate complexity score"""
         total_factors = sum(factors.values())
-        return min(total_factors * 0.5, 3.0)
+        return _COMPLEXITY_SCORES[min(total_factors, 6)]
     
     def _determine_complexity_level(self, score: float) -> str:
         """Determine complexity level"""
-        if score <= 1:
-            return "simple"
-        elif score <= 2:
-            return "moderate"
-        elif score <= 3:
-            return "complex"
-        else:
-            return "expert"
+        return _COMPLEXITY_LEVEL_NAMES[_score_band(score)]
     
     def _estimate_development_effort(self, complexity_score: float) -> str:
         """Estimate development effort"""
-        if complexity_score <= 1:
-            return "1-2 hours"
-        elif complexity_score <= 2:
-            return "2-4 hours"
-        elif complexity_score <= 3:
-            return "4-8 hours"
-        else:
-            return "8+ hours"
+        return _DEVELOPMENT_EFFORTS[_score_band(complexity_score)]
     
-    def _identify_accessibility_requirements(self, prompt: str, design_analysis: Dict) -> List[str]:
+    def _identify_accessibility_requirements(self, keyword_mask: int, design_analysis: Dict) -> List[str]:
         """Identify accessibility requirements"""
         requirements = []
-        prompt_lower = prompt.lower()
         
-        if "accessibility" in prompt_lower or "a11y" in prompt_lower:
-            requirements.extend(self.accessibility_requirements)
+        if keyword_mask & (_KW_ACCESSIBILITY | _KW_A11Y):
+            requirements.extend(_ACCESSIBILITY_REQUIREMENTS)
         else:
             # Basic accessibility for all components
-            requirements.extend(["semantic_html", "aria_labels", "keyboard_navigation"])
+            requirements.extend(_BASIC_ACCESSIBILITY_REQUIREMENTS)
         
         return requirements
     
     def _generate_accessibility_guidelines(self, requirements: List[str]) -> List[str]:
         """Generate accessibility implementation guidelines"""
-        guidelines = []
-        
-        for requirement in requirements:
-            if requirement == "semantic_html":
-                guidelines.append("• Use semantic HTML elements (button, nav, main, etc.)")
-            elif requirement == "aria_labels":
-                guidelines.append("• Add appropriate ARIA labels and roles")
-            elif requirement == "keyboard_navigation":
-                guidelines.append("• Ensure keyboard navigation works properly")
-            elif requirement == "color_contrast":
-                guidelines.append("• Maintain sufficient color contrast ratios")
-            elif requirement == "focus_indicators":
-                guidelines.append("• Provide visible focus indicators")
-            elif requirement == "screen_reader_support":
-                guidelines.append("• Test with screen readers")
-        
-        return guidelines
+        return [_ACCESSIBILITY_GUIDELINES[requirement] for requirement in requirements
+                if requirement in _ACCESSIBILITY_GUIDELINES]
     
     def _calculate_accessibility_score(self, requirements: List[str]) -> float:
         """Calculate accessibility score"""
         if not requirements:
             return 0.0
         
-        return min(len(requirements) / len(self.accessibility_requirements), 1.0)
+        return min(len(requirements) / len(_ACCESSIBILITY_REQUIREMENTS), 1.0)
     
     def _identify_priority_accessibility_items(self, requirements: List[str]) -> List[str]:
         """Identify priority accessibility items"""
@@ -648,18 +751,14 @@ class DesignTechnologistAgent:
         if not token_categories:
             return "No tokens extracted"
         
-        formatted = []
-        for category, tokens in token_categories.items():
-            formatted.append(f"**{category.title()}:** {', '.join(tokens)}")
-        
-        return "\n".join(formatted)
+        return "\n".join(f"**{category.title()}:** {', '.join(tokens)}" for category, tokens in token_categories.items())
     
     def _format_accessibility_requirements(self, requirements: List[str]) -> str:
         """Format accessibility requirements for output"""
         if not requirements:
             return "No specific requirements"
         
-        return "\n".join([f"• {req.replace('_', ' ').title()}" for req in requirements])
+        return "\n".join(f"• {req.replace('_', ' ').title()}" for req in requirements)
     
     def _format_implementation_guidelines(self, guidelines: List[str]) -> str:
         """Format implementation guidelines for output"""
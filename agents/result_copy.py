@@ -0,0 +1,17 @@
+"""
+Result Copy - Fusion v14
+Per-caller copies of cached agent results
+"""
+
+from typing import Any
+
+def copy_result(value: Any) -> Any:
+    """Copy the dicts and lists of a cached agent result, so a caller can
+    mutate its copy without touching the cache; strings, numbers, tuples of
+    them and read-only mappings are shared as-is"""
+    value_type = type(value)
+    if value_type is dict:
+        return {key: copy_result(item) for key, item in value.items()}
+    if value_type is list:
+        return [copy_result(item) for item in value]
+    return value
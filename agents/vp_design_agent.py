@@ -5,7 +5,7 @@ Refactored as tool runner with async capabilities
 
 import asyncio
 import time
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Sequence
 import logging
 
 class VPDesignAgent:
@@ -29,7 +29,20 @@ class VPDesignAgent:
     async def run(self, input_prompt: str, tools: Dict[str, Any] = None) -> Dict[str, Any]:
         """Main async execution method"""
         return await self.run_async(input_prompt, tools)
-        
+
+    async def run_many(self, prompts: List[str], tools: Dict[str, Any] = None,
+                       concurrency: int = 16) -> List[Dict[str, Any]]:
+        """Run a batch of prompts concurrently, bounded by a semaphore"""
+
+        semaphore = asyncio.Semaphore(concurrency)
+        return await asyncio.gather(*[self._bounded(semaphore, prompt, tools) for prompt in prompts])
+
+    async def _bounded(self, semaphore: asyncio.Semaphore, input_prompt: str,
+                       tools: Dict[str, Any] = None) -> Dict[str, Any]:
+        """Run a single prompt once a batch slot is available"""
+        async with semaphore:
+            return await self.run_async(input_prompt, tools)
+
     async def run_async(self, input_prompt: str, tools: Dict[str, Any] = None) -> Dict[str, Any]:
         """Async execution with tool coordination"""
         
@@ -131,15 +144,17 @@ class VPDesignAgent:
         """Generate design recommendations based on analysis"""
         
         recommendations = []
+        user_needs = analysis.get("user_needs") or ()
+        request_type = analysis.get("request_type")
         
         # Generate recommendations based on design principles
         for principle in self.design_principles:
-            if self._should_apply_principle(principle, analysis):
+            if self._should_apply_principle(principle, user_needs, request_type):
                 recommendation = await self._create_recommendation(principle, analysis)
                 recommendations.append(recommendation)
                 
         # Add specific recommendations based on analysis
-        if analysis.get("request_type") == "ui_design":
+        if request_type == "ui_design":
             recommendations.append({
                 "type": "ui_improvement",
                 "title": "Enhance Visual Hierarchy",
@@ -148,7 +163,7 @@ class VPDesignAgent:
                 "confidence": 0.9
             })
             
-        if analysis.get("request_type") == "ux_design":
+        if request_type == "ux_design":
             recommendations.append({
                 "type": "ux_improvement", 
                 "title": "Optimize User Flow",
@@ -258,23 +273,24 @@ class VPDesignAgent:
         else:
             return "general_users"
             
-    def _should_apply_principle(self, principle: str, analysis: Dict[str, Any]) -> bool:
+    def _should_apply_principle(self, principle: str, user_needs: Sequence[str],
+                                request_type: Optional[str]) -> bool:
         """Determine if a design principle should be applied"""
         
         if principle == "User-centered design":
             return True  # Always apply
         elif principle == "Accessibility first":
-            return "accessibility" in analysis.get("user_needs", [])
+            return "accessibility" in user_needs
         elif principle == "Consistent visual hierarchy":
-            return analysis.get("request_type") in ["ui_design", "general_design"]
+            return request_type in ("ui_design", "general_design")
         elif principle == "Clear information architecture":
-            return analysis.get("request_type") in ["ux_design", "general_design"]
+            return request_type in ("ux_design", "general_design")
         elif principle == "Responsive design patterns":
-            return "mobile_friendly" in analysis.get("user_needs", [])
+            return "mobile_friendly" in user_needs
         elif principle == "Performance optimization":
-            return "performance" in analysis.get("user_needs", [])
+            return "performance" in user_needs
         elif principle == "Brand consistency":
-            return analysis.get("request_type") == "brand_design"
+            return request_type == "brand_design"
             
         return False
         
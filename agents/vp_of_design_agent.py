@@ -5,10 +5,301 @@ Acts as a design executive reviewing design decisions, aligning with vision, cri
 """
 
 import asyncio
+import bisect
+import hashlib
+import re
+import string
 import time
 import logging
-from typing import Dict, Any, List, Optional
-from datetime import datetime
+from collections import OrderedDict
+from types import MappingProxyType
+from typing import Dict, Any, FrozenSet, List, Mapping, Optional, Sequence
+
+from .result_copy import copy_result
+
+_LOGGER = logging.getLogger(__name__)
+
+# Every keyword the analysis helpers probe the prompt for
+_KEYWORDS = (
+    "user-centered", "user research", "data-driven", "analytics", "design system", "components",
+    "accessibility", "usability", "user experience", "consistency", "innovation",
+    "mature", "process", "guidelines", "ad hoc", "reactive",
+    "business", "strategy", "user", "vision",
+    "experimentation", "cutting_edge",
+    "inconsistent", "fragmented",
+    "scalable", "maintainable", "modular",
+    "inclusive", "wcag"
+)
+
+def _trie_pattern(words) -> str:
+    """Build a regex alternation factored as a prefix trie, so each position is
+    matched by walking shared prefixes once (the goto function of an
+    Aho-Corasick automaton) instead of retrying every keyword; longest wins"""
+    trie: Dict[str, Dict] = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = {}
+    
+    def build(node: Dict[str, Dict]) -> str:
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        pattern = branches[0] if len(branches) == 1 else "(?:%s)" % "|".join(branches)
+        return "(?:%s)?" % pattern if "" in node else pattern
+    
+    return build(trie)
+
+# Zero-width lookahead so overlapping keywords are all found in one pass
+_KEYWORD_RE = re.compile("(?=(%s))" % _trie_pattern(_KEYWORDS))
+
+# A match also implies every keyword it contains (e.g. "user research" -> "user")
+_KEYWORD_CLOSURE = {keyword: frozenset(k for k in _KEYWORDS if k in keyword) for keyword in _KEYWORDS}
+
+# Design leadership principles
+_DESIGN_LEADERSHIP_PRINCIPLES = {
+    "strategic_alignment": ["business_objectives", "user_needs", "design_vision"],
+    "system_thinking": ["design_systems", "component_libraries", "design_tokens"],
+    "cross_functional_collaboration": ["engineering_partnership", "product_alignment", "stakeholder_communication"],
+    "quality_assurance": ["design_reviews", "usability_testing", "accessibility_compliance"],
+    "innovation_culture": ["design_thinking", "experimentation", "continuous_improvement"]
+}
+
+# Design system health indicators
+_SYSTEM_HEALTH_INDICATORS = {
+    "consistency": ["design_tokens", "component_reuse", "style_guidelines"],
+    "scalability": ["modular_architecture", "responsive_patterns", "platform_agnostic"],
+    "accessibility": ["wcag_compliance", "inclusive_design", "usability_testing"],
+    "performance": ["design_efficiency", "load_times", "user_experience_metrics"],
+    "maintainability": ["documentation", "version_control", "design_ops"]
+}
+
+# Design maturity levels
+_DESIGN_MATURITY_LEVELS = {
+    "ad_hoc": {
+        "description": "No formal design process",
+        "characteristics": ["reactive_design", "inconsistent_quality", "limited_collaboration"],
+        "improvement_areas": ["establish_processes", "create_guidelines", "build_team"]
+    },
+    "repeatable": {
+        "description": "Basic design processes in place",
+        "characteristics": ["consistent_quality", "basic_guidelines", "team_collaboration"],
+        "improvement_areas": ["standardize_processes", "expand_guidelines", "enhance_tools"]
+    },
+    "defined": {
+        "description": "Well-defined design system",
+        "characteristics": ["design_system", "comprehensive_guidelines", "cross_functional_work"],
+        "improvement_areas": ["optimize_processes", "enhance_automation", "measure_impact"]
+    },
+    "managed": {
+        "description": "Data-driven design decisions",
+        "characteristics": ["metrics_driven", "continuous_improvement", "predictable_outcomes"],
+        "improvement_areas": ["advanced_analytics", "ai_integration", "predictive_design"]
+    },
+    "optimizing": {
+        "description": "Continuous design innovation",
+        "characteristics": ["innovation_culture", "rapid_iteration", "market_leadership"],
+        "improvement_areas": ["sustain_innovation", "scale_impact", "future_vision"]
+    }
+}
+
+# Keyword decision rules, checked in order: a rule fires when every one of its
+# keyword groups has at least one keyword present in the prompt
+_DESIGN_APPROACH_RULES = (
+    ((frozenset({"user-centered", "user research"}),), {"type": "user_centered", "strength": "high", "focus": "user_needs"}),
+    ((frozenset({"data-driven", "analytics"}),), {"type": "data_driven", "strength": "medium", "focus": "metrics"}),
+    ((frozenset({"design system", "components"}),), {"type": "systematic", "strength": "high", "focus": "consistency"})
+)
+_DEFAULT_DESIGN_APPROACH = {"type": "general", "strength": "medium", "focus": "balanced"}
+
+_DESIGN_MATURITY_RULES = (
+    ((frozenset({"design system"}), frozenset({"mature"})), "managed"),
+    ((frozenset({"design system"}),), "defined"),
+    ((frozenset({"process", "guidelines"}),), "repeatable"),
+    ((frozenset({"ad hoc", "reactive"}),), "ad_hoc")
+)
+
+def _first_matching_rule(rules, tokens: FrozenSet[str], default):
+    """Return the result of the first rule whose keyword groups all hit the tokens"""
+    for groups, result in rules:
+        if all(not tokens.isdisjoint(group) for group in groups):
+            return result
+    return default
+
+# Number of prompt reviews kept by VPOfDesignAgent._cached_review
+_RESULT_CACHE_SIZE = 512
+
+# Quality score cut-offs and the label for each band between them
+_QUALITY_THRESHOLDS = (0.7, 0.8, 0.9)
+_QUALITY_LABELS = (
+    "Needs improvement in design quality",
+    "Satisfactory design quality",
+    "Good design quality",
+    "Excellent design quality"
+)
+
+# Health score boost per design maturity level
+_MATURITY_BOOST = {"managed": 0.1, "defined": 0.05, "repeatable": 0.0, "ad_hoc": -0.1}
+
+# Cross-functional impact areas
+_CROSS_FUNCTIONAL_IMPACT = {
+    "engineering": ["development_velocity", "code_quality", "technical_debt"],
+    "product": ["feature_adoption", "user_satisfaction", "business_metrics"],
+    "marketing": ["brand_consistency", "user_acquisition", "conversion_rates"],
+    "customer_support": ["user_onboarding", "support_efficiency", "customer_satisfaction"]
+}
+
+# Cross-functional impact results; they do not depend on the prompt, so every
+# request shares the same read-only objects
+_ENGINEERING_IMPACT = MappingProxyType({
+    "development_velocity": "improved",
+    "code_quality": "enhanced",
+    "technical_debt": "reduced",
+    "assessment": "Positive impact on engineering efficiency"
+})
+
+_PRODUCT_IMPACT = MappingProxyType({
+    "feature_adoption": "increased",
+    "user_satisfaction": "improved",
+    "business_metrics": "positive",
+    "assessment": "Strong positive impact on product metrics"
+})
+
+_MARKETING_IMPACT = MappingProxyType({
+    "brand_consistency": "maintained",
+    "user_acquisition": "improved",
+    "conversion_rates": "enhanced",
+    "assessment": "Good alignment with marketing objectives"
+})
+
+_CUSTOMER_SUPPORT_IMPACT = MappingProxyType({
+    "user_onboarding": "simplified",
+    "support_efficiency": "improved",
+    "customer_satisfaction": "enhanced",
+    "assessment": "Reduced support burden through better UX"
+})
+
+_OVERALL_IMPACT = MappingProxyType({
+    "score": 0.85,
+    "assessment": "Strong positive impact across all functions",
+    "summary": "Design decisions are well-aligned with cross-functional objectives"
+})
+
+_COLLABORATION_RECOMMENDATIONS = (
+    "Establish regular design-engineering sync meetings",
+    "Create shared success metrics across functions",
+    "Implement cross-functional design reviews",
+    "Develop shared design system governance"
+)
+
+# Shared read-only default for nested lookups that may be missing
+_EMPTY: Dict[str, Any] = {}
+
+# Markdown layout of the executive review, filled by VPOfDesignAgent._flatten_output
+_ENHANCED_OUTPUT_TEMPLATE = """# VP of Design Executive Review
+
+## Original Request
+{prompt}
+
+## Design Decision Review
+
+### Design Approach
+**Approach:** {approach_type}
+**Quality Score:** {quality_score:.2f}/1.00
+**Maturity Level:** {maturity_level}
+
+### Strategic Recommendations
+{strategic_recommendations}
+
+### Improvement Opportunities
+{improvement_opportunities}
+
+## Vision Alignment Assessment
+
+### Alignment Score
+**Score:** {alignment_score:.2f}/1.00
+
+### Strategic Alignment
+{strategic_alignment}
+
+### User-Centered Focus
+{user_centered_focus}
+
+### Innovation Alignment
+{innovation_alignment}
+
+### Alignment Gaps
+{alignment_gaps}
+
+## Design System Health Critique
+
+### Overall Health Score
+**Score:** {overall_health:.2f}/1.00
+
+### System Maturity
+**Level:** {system_maturity_level}
+**Assessment:** {system_maturity_assessment}
+
+### Consistency & Coherence
+**Score:** {consistency_score:.2f}/1.00
+**Issues:** {consistency_issues}
+
+### Scalability & Maintainability
+**Score:** {scalability_score:.2f}/1.00
+**Assessment:** {scalability_assessment}
+
+### Accessibility & Inclusivity
+**Score:** {accessibility_score:.2f}/1.00
+**Compliance:** {accessibility_compliance}
+
+### Health Improvements
+{health_improvements}
+
+## Cross-Functional Impact Analysis
+
+### Engineering Impact
+**Velocity:** {engineering_velocity}
+**Quality:** {engineering_quality}
+
+### Product Impact
+**Adoption:** {product_adoption}
+**Satisfaction:** {product_satisfaction}
+
+### Marketing Impact
+**Brand Consistency:** {marketing_brand_consistency}
+**Conversion:** {marketing_conversion}
+
+### Customer Support Impact
+**Onboarding:** {support_onboarding}
+**Efficiency:** {support_efficiency}
+
+### Overall Impact
+**Score:** {overall_impact_score:.2f}/1.00
+**Assessment:** {overall_impact_assessment}
+
+### Collaboration Recommendations
+{collaboration_recommendations}
+
+## Executive Confidence
+**Score:** {confidence:.2f}/1.00
+
+*Generated by Fusion v14 VP of Design Agent*"""
+
+# The template split once into (literal text, field name, format spec) segments
+_ENHANCED_OUTPUT_SEGMENTS = tuple(
+    (literal, field, spec) for literal, field, spec, _ in string.Formatter().parse(_ENHANCED_OUTPUT_TEMPLATE)
+)
+
+def _render_segments(segments, values: Dict[str, Any]) -> str:
+    """Render pre-parsed template segments by joining literal text and formatted fields"""
+    parts = []
+    append = parts.append
+    for literal, field, spec in segments:
+        append(literal)
+        if field is not None:
+            append(format(values[field], spec))
+    return "".join(parts)
 
 class VPOfDesignAgent:
     """
@@ -16,133 +307,124 @@ class VPOfDesignAgent:
     Acts as a design executive reviewing design decisions, aligning with vision, critiquing system health, and advising on cross-functional impact
     """
     
-    def __init__(self):
-        self.logger = logging.getLogger("VPOfDesignAgent")
-        
-        # Design leadership principles
-        self.design_leadership_principles = {
-            "strategic_alignment": ["business_objectives", "user_needs", "design_vision"],
-            "system_thinking": ["design_systems", "component_libraries", "design_tokens"],
-            "cross_functional_collaboration": ["engineering_partnership", "product_alignment", "stakeholder_communication"],
-            "quality_assurance": ["design_reviews", "usability_testing", "accessibility_compliance"],
-            "innovation_culture": ["design_thinking", "experimentation", "continuous_improvement"]
-        }
-        
-        # Design system health indicators
-        self.system_health_indicators = {
-            "consistency": ["design_tokens", "component_reuse", "style_guidelines"],
-            "scalability": ["modular_architecture", "responsive_patterns", "platform_agnostic"],
-            "accessibility": ["wcag_compliance", "inclusive_design", "usability_testing"],
-            "performance": ["design_efficiency", "load_times", "user_experience_metrics"],
-            "maintainability": ["documentation", "version_control", "design_ops"]
-        }
-        
-        # Design maturity levels
-        self.design_maturity_levels = {
-            "ad_hoc": {
-                "description": "No formal design process",
-                "characteristics": ["reactive_design", "inconsistent_quality", "limited_collaboration"],
-                "improvement_areas": ["establish_processes", "create_guidelines", "build_team"]
-            },
-            "repeatable": {
-                "description": "Basic design processes in place",
-                "characteristics": ["consistent_quality", "basic_guidelines", "team_collaboration"],
-                "improvement_areas": ["standardize_processes", "expand_guidelines", "enhance_tools"]
-            },
-            "defined": {
-                "description": "Well-defined design system",
-                "characteristics": ["design_system", "comprehensive_guidelines", "cross_functional_work"],
-                "improvement_areas": ["optimize_processes", "enhance_automation", "measure_impact"]
-            },
-            "managed": {
-                "description": "Data-driven design decisions",
-                "characteristics": ["metrics_driven", "continuous_improvement", "predictable_outcomes"],
-                "improvement_areas": ["advanced_analytics", "ai_integration", "predictive_design"]
-            },
-            "optimizing": {
-                "description": "Continuous design innovation",
-                "characteristics": ["innovation_culture", "rapid_iteration", "market_leadership"],
-                "improvement_areas": ["sustain_innovation", "scale_impact", "future_vision"]
-            }
-        }
-        
-        # Cross-functional impact areas
-        self.cross_functional_impact = {
-            "engineering": ["development_velocity", "code_quality", "technical_debt"],
-            "product": ["feature_adoption", "user_satisfaction", "business_metrics"],
-            "marketing": ["brand_consistency", "user_acquisition", "conversion_rates"],
-            "customer_support": ["user_onboarding", "support_efficiency", "customer_satisfaction"]
-        }
-        
+    # Stateless: no per-instance __dict__
+    __slots__ = ()
+    
+    # Taxonomies are shared by every instance rather than rebuilt per agent
+    design_leadership_principles = _DESIGN_LEADERSHIP_PRINCIPLES
+    system_health_indicators = _SYSTEM_HEALTH_INDICATORS
+    design_maturity_levels = _DESIGN_MATURITY_LEVELS
+    cross_functional_impact = _CROSS_FUNCTIONAL_IMPACT
+    
+    # Reviews of recent prompts keyed by prompt digest, shared by every instance (LRU order)
+    _result_cache: "OrderedDict[bytes, Dict[str, Any]]" = OrderedDict()
+    
     async def run_async(self, prompt: str, context: Dict[str, Any]) -> Dict[str, Any]:
         """
         Main async execution method for VP of Design Agent
         """
         start_time = time.time()
-        self.logger.info("VP of Design Agent starting analysis")
+        _LOGGER.info("VP of Design Agent starting analysis")
         
         try:
-            # Review design decisions
-            design_review = await self._review_design_decisions(prompt)
-            
-            # Assess vision alignment
-            vision_alignment = await self._assess_vision_alignment(prompt, design_review)
-            
-            # Critique system health
-            system_health_critique = await self._critique_system_health(prompt, design_review)
-            
-            # Analyze cross-functional impact
-            cross_functional_impact = await self._analyze_cross_functional_impact(prompt, design_review)
-            
-            # Create enhanced output
-            enhanced_output = await self._create_enhanced_output(prompt, design_review, vision_alignment, system_health_critique, cross_functional_impact)
+            review = self._cached_review(prompt)
             
             execution_time = time.time() - start_time
-            confidence = self._calculate_confidence(design_review, vision_alignment, system_health_critique)
             
-            self.logger.info(f"VP of Design Agent completed in {execution_time:.2f}s")
+            _LOGGER.info("VP of Design Agent completed in %.2fs", execution_time)
             
             return {
-                "output": enhanced_output,
-                "enhanced_output": enhanced_output,
-                "confidence": confidence,
-                "design_review": design_review,
-                "vision_alignment": vision_alignment,
-                "system_health_critique": system_health_critique,
-                "cross_functional_impact": cross_functional_impact,
+                **review,
                 "execution_time": execution_time,
                 "shared_state": {
-                    "design_maturity": design_review.get("maturity_level"),
-                    "vision_alignment_score": vision_alignment.get("alignment_score"),
-                    "system_health_score": system_health_critique.get("overall_health"),
-                    "impact_areas": len(cross_functional_impact.get("impact_areas", [])),
-                    "analysis_timestamp": datetime.now().timestamp()
+                    **review["shared_state"],
+                    "analysis_timestamp": time.time()
                 }
             }
             
         except Exception as e:
             execution_time = time.time() - start_time
-            self.logger.error(f"VP of Design Agent failed: {e}")
+            _LOGGER.error("VP of Design Agent failed: %s", e)
             return {
                 "error": str(e),
                 "confidence": 0.0,
                 "execution_time": execution_time
             }
     
-    async def _review_design_decisions(self, prompt: str) -> Dict[str, Any]:
+    def _cached_review(self, prompt: str) -> Dict[str, Any]:
+        """Return the review for a prompt, reusing the result of an identical earlier prompt.
+        Each caller gets its own copy, so the cached review is never handed out"""
+        key = hashlib.blake2b(prompt.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+        cache = VPOfDesignAgent._result_cache
+        
+        review = cache.get(key)
+        if review is None:
+            review = self._review(prompt)
+            cache[key] = review
+            if len(cache) > _RESULT_CACHE_SIZE:
+                cache.popitem(last=False)
+        else:
+            cache.move_to_end(key)
+        return copy_result(review)
+    
+    def _review(self, prompt: str) -> Dict[str, Any]:
+        """Run the full analysis pipeline; everything except timing depends only on the prompt"""
+        
+        # Scan the prompt for keywords once
+        tokens = self._extract_tokens(prompt)
+        
+        # Review design decisions
+        design_review = self._review_design_decisions(tokens)
+        
+        # Assess vision alignment
+        vision_alignment = self._assess_vision_alignment(tokens, design_review)
+        
+        # Critique system health
+        system_health_critique = self._critique_system_health(tokens, design_review)
+        
+        # Analyze cross-functional impact
+        cross_functional_impact = self._analyze_cross_functional_impact(prompt, design_review)
+        
+        confidence = self._calculate_confidence(design_review, vision_alignment, system_health_critique)
+        
+        # Create enhanced output
+        enhanced_output = self._create_enhanced_output(prompt, design_review, vision_alignment, system_health_critique, cross_functional_impact, confidence)
+        
+        return {
+            "output": enhanced_output,
+            "enhanced_output": enhanced_output,
+            "confidence": confidence,
+            "design_review": design_review,
+            "vision_alignment": vision_alignment,
+            "system_health_critique": system_health_critique,
+            "cross_functional_impact": cross_functional_impact,
+            "shared_state": {
+                "design_maturity": design_review.get("maturity_level"),
+                "vision_alignment_score": vision_alignment.get("alignment_score"),
+                "system_health_score": system_health_critique.get("overall_health"),
+                "impact_areas": len(cross_functional_impact.get("impact_areas", []))
+            }
+        }
+    
+    def _extract_tokens(self, prompt: str) -> FrozenSet[str]:
+        """Return every known keyword contained in the prompt; the only place it is lowercased"""
+        matches = set(_KEYWORD_RE.findall(prompt.lower()))
+        return frozenset().union(*(_KEYWORD_CLOSURE[match] for match in matches))
+    
+    def _review_design_decisions(self, tokens: FrozenSet[str]) -> Dict[str, Any]:
         """Review design decisions and provide executive perspective"""
         
         # Analyze design approach
-        design_approach = self._analyze_design_approach(prompt)
+        design_approach = self._analyze_design_approach(tokens)
         
         # Assess design quality
-        design_quality = self._assess_design_quality(prompt)
+        design_quality = self._assess_design_quality(tokens)
         
         # Evaluate design maturity
-        design_maturity = self._evaluate_design_maturity(prompt)
+        design_maturity = self._evaluate_design_maturity(tokens)
         
         # Identify improvement opportunities
-        improvement_opportunities = self._identify_improvement_opportunities(prompt, design_approach, design_quality)
+        improvement_opportunities = self._identify_improvement_opportunities(tokens, design_approach, design_quality)
         
         return {
             "design_approach": design_approach,
@@ -152,17 +434,17 @@ class VPOfDesignAgent:
             "strategic_recommendations": self._generate_strategic_recommendations(design_approach, design_quality, design_maturity)
         }
     
-    async def _assess_vision_alignment(self, prompt: str, design_review: Dict) -> Dict[str, Any]:
+    def _assess_vision_alignment(self, tokens: FrozenSet[str], design_review: Dict) -> Dict[str, Any]:
         """Assess alignment with design vision and business objectives"""
         
         # Evaluate strategic alignment
-        strategic_alignment = self._evaluate_strategic_alignment(prompt, design_review)
+        strategic_alignment = self._evaluate_strategic_alignment(tokens, design_review)
         
         # Assess user-centered focus
-        user_centered_focus = self._assess_user_centered_focus(prompt, design_review)
+        user_centered_focus = self._assess_user_centered_focus(tokens, design_review)
         
         # Review innovation alignment
-        innovation_alignment = self._review_innovation_alignment(prompt, design_review)
+        innovation_alignment = self._review_innovation_alignment(tokens, design_review)
         
         # Calculate overall alignment score
         alignment_score = self._calculate_alignment_score(strategic_alignment, user_centered_focus, innovation_alignment)
@@ -175,20 +457,20 @@ class VPOfDesignAgent:
             "alignment_gaps": self._identify_alignment_gaps(strategic_alignment, user_centered_focus, innovation_alignment)
         }
     
-    async def _critique_system_health(self, prompt: str, design_review: Dict) -> Dict[str, Any]:
+    def _critique_system_health(self, tokens: FrozenSet[str], design_review: Dict) -> Dict[str, Any]:
         """Critique design system health and sustainability"""
         
         # Assess design system maturity
-        system_maturity = self._assess_system_maturity(prompt, design_review)
+        system_maturity = self._assess_system_maturity(design_review)
         
         # Evaluate consistency and coherence
-        consistency_coherence = self._evaluate_consistency_coherence(prompt, design_review)
+        consistency_coherence = self._evaluate_consistency_coherence(tokens, design_review)
         
         # Review scalability and maintainability
-        scalability_maintainability = self._review_scalability_maintainability(prompt, design_review)
+        scalability_maintainability = self._review_scalability_maintainability(tokens, design_review)
         
         # Assess accessibility and inclusivity
-        accessibility_inclusivity = self._assess_accessibility_inclusivity(prompt, design_review)
+        accessibility_inclusivity = self._assess_accessibility_inclusivity(tokens, design_review)
         
         # Calculate overall health score
         overall_health = self._calculate_health_score(system_maturity, consistency_coherence, scalability_maintainability, accessibility_inclusivity)
@@ -202,7 +484,7 @@ class VPOfDesignAgent:
             "health_improvements": self._identify_health_improvements(system_maturity, consistency_coherence, scalability_maintainability, accessibility_inclusivity)
         }
     
-    async def _analyze_cross_functional_impact(self, prompt: str, design_review: Dict) -> Dict[str, Any]:
+    def _analyze_cross_functional_impact(self, prompt: str, design_review: Dict) -> Dict[str, Any]:
         """Analyze cross-functional impact of design decisions"""
         
         # Analyze engineering impact
@@ -228,131 +510,94 @@ class VPOfDesignAgent:
             "collaboration_recommendations": self._generate_collaboration_recommendations(engineering_impact, product_impact, marketing_impact, customer_support_impact)
         }
     
-    async def _create_enhanced_output(self, prompt: str, design_review: Dict, vision_alignment: Dict, system_health_critique: Dict, cross_functional_impact: Dict) -> str:
+    def _create_enhanced_output(self, prompt: str, design_review: Dict, vision_alignment: Dict, system_health_critique: Dict, cross_functional_impact: Dict, confidence: float) -> str:
         """Create enhanced output with executive design perspective"""
         
-        return f"""# VP of Design Executive Review
-
-## Original Request
-{prompt}
-
-## Design Decision Review
-
-### Design Approach
-**Approach:** {design_review.get('design_approach', {}).get('type', 'unknown')}
-**Quality Score:** {design_review.get('design_quality', {}).get('score', 0):.2f}/1.00
-**Maturity Level:** {design_review.get('maturity_level', 'unknown').upper()}
-
-### Strategic Recommendations
-{', '.join(design_review.get('strategic_recommendations', ['None provided']))}
-
-### Improvement Opportunities
-{', '.join(design_review.get('improvement_opportunities', ['None identified']))}
-
-## Vision Alignment Assessment
-
-### Alignment Score
-**Score:** {vision_alignment.get('alignment_score', 0):.2f}/1.00
-
-### Strategic Alignment
-{vision_alignment.get('strategic_alignment', {}).get('assessment', 'Not assessed')}
-
-### User-Centered Focus
-{vision_alignment.get('user_centered_focus', {}).get('assessment', 'Not assessed')}
-
-### Innovation Alignment
-{vision_alignment.get('innovation_alignment', {}).get('assessment', 'Not assessed')}
-
-### Alignment Gaps
-{', '.join(vision_alignment.get('alignment_gaps', ['None identified']))}
-
-## Design System Health Critique
-
-### Overall Health Score
-**Score:** {system_health_critique.get('overall_health', 0):.2f}/1.00
-
-### System Maturity
-**Level:** {system_health_critique.get('system_maturity', {}).get('level', 'unknown')}
-**Assessment:** {system_health_critique.get('system_maturity', {}).get('assessment', 'Not assessed')}
-
-### Consistency & Coherence
-**Score:** {system_health_critique.get('consistency_coherence', {}).get('score', 0):.2f}/1.00
-**Issues:** {', '.join(system_health_critique.get('consistency_coherence', {}).get('issues', ['None identified']))}
-
-### Scalability & Maintainability
-**Score:** {system_health_critique.get('scalability_maintainability', {}).get('score', 0):.2f}/1.00
-**Assessment:** {system_health_critique.get('scalability_maintainability', {}).get('assessment', 'Not assessed')}
-
-### Accessibility & Inclusivity
-**Score:** {system_health_critique.get('accessibility_inclusivity', {}).get('score', 0):.2f}/1.00
-**Compliance:** {system_health_critique.get('accessibility_inclusivity', {}).get('compliance_level', 'unknown')}
-
-### Health Improvements
-{', '.join(system_health_critique.get('health_improvements', ['None identified']))}
-
-## Cross-Functional Impact Analysis
-
-### Engineering Impact
-**Velocity:** {cross_functional_impact.get('impact_areas', {}).get('engineering', {}).get('development_velocity', 'unknown')}
-**Quality:** {cross_functional_impact.get('impact_areas', {}).get('engineering', {}).get('code_quality', 'unknown')}
-
-### Product Impact
-**Adoption:** {cross_functional_impact.get('impact_areas', {}).get('product', {}).get('feature_adoption', 'unknown')}
-**Satisfaction:** {cross_functional_impact.get('impact_areas', {}).get('product', {}).get('user_satisfaction', 'unknown')}
-
-### Marketing Impact
-**Brand Consistency:** {cross_functional_impact.get('impact_areas', {}).get('marketing', {}).get('brand_consistency', 'unknown')}
-**Conversion:** {cross_functional_impact.get('impact_areas', {}).get('marketing', {}).get('conversion_rates', 'unknown')}
-
-### Customer Support Impact
-**Onboarding:** {cross_functional_impact.get('impact_areas', {}).get('customer_support', {}).get('user_onboarding', 'unknown')}
-**Efficiency:** {cross_functional_impact.get('impact_areas', {}).get('customer_support', {}).get('support_efficiency', 'unknown')}
-
-### Overall Impact
-**Score:** {cross_functional_impact.get('overall_impact', {}).get('score', 0):.2f}/1.00
-**Assessment:** {cross_functional_impact.get('overall_impact', {}).get('assessment', 'Not assessed')}
-
-### Collaboration Recommendations
-{', '.join(cross_functional_impact.get('collaboration_recommendations', ['None provided']))}
-
-## Executive Confidence
-**Score:** {self._calculate_confidence(design_review, vision_alignment, system_health_critique):.2f}/1.00
-
-*Generated by Fusion v14 VP of Design Agent*"""
+        return _render_segments(
+            _ENHANCED_OUTPUT_SEGMENTS,
+            self._flatten_output(prompt, design_review, vision_alignment, system_health_critique, cross_functional_impact, confidence)
+        )
+    
+    def _flatten_output(self, prompt: str, design_review: Dict, vision_alignment: Dict, system_health_critique: Dict, cross_functional_impact: Dict, confidence: float) -> Dict[str, Any]:
+        """Collect every field of the enhanced output template into a flat dict"""
+        
+        # Walk each nested section once
+        approach = design_review.get('design_approach') or _EMPTY
+        quality = design_review.get('design_quality') or _EMPTY
+        strategic = vision_alignment.get('strategic_alignment') or _EMPTY
+        user_focus = vision_alignment.get('user_centered_focus') or _EMPTY
+        innovation = vision_alignment.get('innovation_alignment') or _EMPTY
+        maturity = system_health_critique.get('system_maturity') or _EMPTY
+        consistency = system_health_critique.get('consistency_coherence') or _EMPTY
+        scalability = system_health_critique.get('scalability_maintainability') or _EMPTY
+        accessibility = system_health_critique.get('accessibility_inclusivity') or _EMPTY
+        impact_areas = cross_functional_impact.get('impact_areas') or _EMPTY
+        eng = impact_areas.get('engineering') or _EMPTY
+        prod = impact_areas.get('product') or _EMPTY
+        mkt = impact_areas.get('marketing') or _EMPTY
+        cs = impact_areas.get('customer_support') or _EMPTY
+        overall_impact = cross_functional_impact.get('overall_impact') or _EMPTY
+        
+        return {
+            "prompt": prompt,
+            "approach_type": approach.get('type', 'unknown'),
+            "quality_score": quality.get('score', 0),
+            "maturity_level": design_review.get('maturity_level', 'unknown').upper(),
+            "strategic_recommendations": ', '.join(design_review.get('strategic_recommendations', ['None provided'])),
+            "improvement_opportunities": ', '.join(design_review.get('improvement_opportunities', ['None identified'])),
+            "alignment_score": vision_alignment.get('alignment_score', 0),
+            "strategic_alignment": strategic.get('assessment', 'Not assessed'),
+            "user_centered_focus": user_focus.get('assessment', 'Not assessed'),
+            "innovation_alignment": innovation.get('assessment', 'Not assessed'),
+            "alignment_gaps": ', '.join(vision_alignment.get('alignment_gaps', ['None identified'])),
+            "overall_health": system_health_critique.get('overall_health', 0),
+            "system_maturity_level": maturity.get('level', 'unknown'),
+            "system_maturity_assessment": maturity.get('assessment', 'Not assessed'),
+            "consistency_score": consistency.get('score', 0),
+            "consistency_issues": ', '.join(consistency.get('issues', ['None identified'])),
+            "scalability_score": scalability.get('score', 0),
+            "scalability_assessment": scalability.get('assessment', 'Not assessed'),
+            "accessibility_score": accessibility.get('score', 0),
+            "accessibility_compliance": accessibility.get('compliance_level', 'unknown'),
+            "health_improvements": ', '.join(system_health_critique.get('health_improvements', ['None identified'])),
+            "engineering_velocity": eng.get('development_velocity', 'unknown'),
+            "engineering_quality": eng.get('code_quality', 'unknown'),
+            "product_adoption": prod.get('feature_adoption', 'unknown'),
+            "product_satisfaction": prod.get('user_satisfaction', 'unknown'),
+            "marketing_brand_consistency": mkt.get('brand_consistency', 'unknown'),
+            "marketing_conversion": mkt.get('conversion_rates', 'unknown'),
+            "support_onboarding": cs.get('user_onboarding', 'unknown'),
+            "support_efficiency": cs.get('support_efficiency', 'unknown'),
+            "overall_impact_score": overall_impact.get('score', 0),
+            "overall_impact_assessment": overall_impact.get('assessment', 'Not assessed'),
+            "collaboration_recommendations": ', '.join(cross_functional_impact.get('collaboration_recommendations', ['None provided'])),
+            "confidence": confidence
+        }
     
-    def _analyze_design_approach(self, prompt: str) -> Dict[str, Any]:
+    def _analyze_design_approach(self, tokens: FrozenSet[str]) -> Dict[str, Any]:
         """Analyze the design approach being used"""
-        prompt_lower = prompt.lower()
-        
-        if "user-centered" in prompt_lower or "user research" in prompt_lower:
-            return {"type": "user_centered", "strength": "high", "focus": "user_needs"}
-        elif "data-driven" in prompt_lower or "analytics" in prompt_lower:
-            return {"type": "data_driven", "strength": "medium", "focus": "metrics"}
-        elif "design system" in prompt_lower or "components" in prompt_lower:
-            return {"type": "systematic", "strength": "high", "focus": "consistency"}
-        else:
-            return {"type": "general", "strength": "medium", "focus": "balanced"}
+        # The rule results are shared templates; each review gets its own dict
+        return dict(_first_matching_rule(_DESIGN_APPROACH_RULES, tokens, _DEFAULT_DESIGN_APPROACH))
     
-    def _assess_design_quality(self, prompt: str) -> Dict[str, Any]:
+    def _assess_design_quality(self, tokens: FrozenSet[str]) -> Dict[str, Any]:
         """Assess the quality of design decisions"""
-        prompt_lower = prompt.lower()
         
         quality_factors = []
         score = 0.7  # Base score
         
-        if "accessibility" in prompt_lower:
+        if "accessibility" in tokens:
             quality_factors.append("accessibility_compliance")
             score += 0.1
             
-        if "usability" in prompt_lower or "user experience" in prompt_lower:
+        if "usability" in tokens or "user experience" in tokens:
             quality_factors.append("usability_focus")
             score += 0.1
             
-        if "consistency" in prompt_lower:
+        if "consistency" in tokens:
             quality_factors.append("design_consistency")
             score += 0.05
             
-        if "innovation" in prompt_lower:
+        if "innovation" in tokens:
             quality_factors.append("innovation_quality")
             score += 0.05
             
@@ -362,22 +607,11 @@ class VPOfDesignAgent:
             "assessment": self._generate_quality_assessment(score)
         }
     
-    def _evaluate_design_maturity(self, prompt: str) -> str:
+    def _evaluate_design_maturity(self, tokens: FrozenSet[str]) -> str:
         """Evaluate design maturity level"""
-        prompt_lower = prompt.lower()
-        
-        if "design system" in prompt_lower and "mature" in prompt_lower:
-            return "managed"
-        elif "design system" in prompt_lower:
-            return "defined"
-        elif "process" in prompt_lower or "guidelines" in prompt_lower:
-            return "repeatable"
-        elif "ad hoc" in prompt_lower or "reactive" in prompt_lower:
-            return "ad_hoc"
-        else:
-            return "repeatable"
+        return _first_matching_rule(_DESIGN_MATURITY_RULES, tokens, "repeatable")
     
-    def _identify_improvement_opportunities(self, prompt: str, design_approach: Dict, design_quality: Dict) -> List[str]:
+    def _identify_improvement_opportunities(self, tokens: FrozenSet[str], design_approach: Dict, design_quality: Dict) -> List[str]:
         """Identify improvement opportunities"""
         opportunities = []
         
@@ -387,7 +621,7 @@ class VPOfDesignAgent:
         if design_quality.get("score", 0) < 0.8:
             opportunities.append("enhance_quality_processes")
             
-        if "accessibility" not in prompt.lower():
+        if "accessibility" not in tokens:
             opportunities.append("improve_accessibility_focus")
             
         return opportunities
@@ -407,22 +641,21 @@ class VPOfDesignAgent:
             
         return recommendations
     
-    def _evaluate_strategic_alignment(self, prompt: str, design_review: Dict) -> Dict[str, Any]:
+    def _evaluate_strategic_alignment(self, tokens: FrozenSet[str], design_review: Dict) -> Dict[str, Any]:
         """Evaluate strategic alignment"""
-        prompt_lower = prompt.lower()
         
         alignment_factors = []
         score = 0.7
         
-        if "business" in prompt_lower or "strategy" in prompt_lower:
+        if "business" in tokens or "strategy" in tokens:
             alignment_factors.append("business_objectives")
             score += 0.1
             
-        if "user" in prompt_lower:
+        if "user" in tokens:
             alignment_factors.append("user_needs")
             score += 0.1
             
-        if "vision" in prompt_lower:
+        if "vision" in tokens:
             alignment_factors.append("design_vision")
             score += 0.1
             
@@ -432,22 +665,21 @@ class VPOfDesignAgent:
             "assessment": "Good alignment with strategic objectives"
         }
     
-    def _assess_user_centered_focus(self, prompt: str, design_review: Dict) -> Dict[str, Any]:
+    def _assess_user_centered_focus(self, tokens: FrozenSet[str], design_review: Dict) -> Dict[str, Any]:
         """Assess user-centered focus"""
-        prompt_lower = prompt.lower()
         
         focus_factors = []
         score = 0.6
         
-        if "user research" in prompt_lower:
+        if "user research" in tokens:
             focus_factors.append("user_research")
             score += 0.2
             
-        if "usability" in prompt_lower:
+        if "usability" in tokens:
             focus_factors.append("usability_testing")
             score += 0.1
             
-        if "user experience" in prompt_lower:
+        if "user experience" in tokens:
             focus_factors.append("ux_focus")
             score += 0.1
             
@@ -457,22 +689,21 @@ class VPOfDesignAgent:
             "assessment": "Moderate user-centered focus"
         }
     
-    def _review_innovation_alignment(self, prompt: str, design_review: Dict) -> Dict[str, Any]:
+    def _review_innovation_alignment(self, tokens: FrozenSet[str], design_review: Dict) -> Dict[str, Any]:
         """Review innovation alignment"""
-        prompt_lower = prompt.lower()
         
         innovation_factors = []
         score = 0.5
         
-        if "innovation" in prompt_lower:
+        if "innovation" in tokens:
             innovation_factors.append("innovation_focus")
             score += 0.2
             
-        if "experimentation" in prompt_lower:
+        if "experimentation" in tokens:
             innovation_factors.append("experimentation")
             score += 0.2
             
-        if "cutting_edge" in prompt_lower:
+        if "cutting_edge" in tokens:
             innovation_factors.append("advanced_techniques")
             score += 0.1
             
@@ -484,13 +715,11 @@ class VPOfDesignAgent:
     
     def _calculate_alignment_score(self, strategic_alignment: Dict, user_centered_focus: Dict, innovation_alignment: Dict) -> float:
         """Calculate overall alignment score"""
-        scores = [
-            strategic_alignment.get("score", 0.0),
-            user_centered_focus.get("score", 0.0),
-            innovation_alignment.get("score", 0.0)
-        ]
-        
-        return sum(scores) / len(scores)
+        return (
+            strategic_alignment.get("score", 0.0)
+            + user_centered_focus.get("score", 0.0)
+            + innovation_alignment.get("score", 0.0)
+        ) / 3
     
     def _identify_alignment_gaps(self, strategic_alignment: Dict, user_centered_focus: Dict, innovation_alignment: Dict) -> List[str]:
         """Identify alignment gaps"""
@@ -507,10 +736,10 @@ class VPOfDesignAgent:
             
         return gaps
     
-    def _assess_system_maturity(self, prompt: str, design_review: Dict) -> Dict[str, Any]:
+    def _assess_system_maturity(self, design_review: Dict) -> Dict[str, Any]:
         """Assess design system maturity"""
         maturity_level = design_review.get("maturity_level", "repeatable")
-        maturity_info = self.design_maturity_levels.get(maturity_level, self.design_maturity_levels["repeatable"])
+        maturity_info = _DESIGN_MATURITY_LEVELS.get(maturity_level, _DESIGN_MATURITY_LEVELS["repeatable"])
         
         return {
             "level": maturity_level,
@@ -520,18 +749,17 @@ class VPOfDesignAgent:
             "assessment": f"Design system is at {maturity_level} maturity level"
         }
     
-    def _evaluate_consistency_coherence(self, prompt: str, design_review: Dict) -> Dict[str, Any]:
+    def _evaluate_consistency_coherence(self, tokens: FrozenSet[str], design_review: Dict) -> Dict[str, Any]:
         """Evaluate consistency and coherence"""
-        prompt_lower = prompt.lower()
         
         issues = []
         score = 0.8
         
-        if "inconsistent" in prompt_lower:
+        if "inconsistent" in tokens:
             issues.append("design_inconsistency")
             score -= 0.2
             
-        if "fragmented" in prompt_lower:
+        if "fragmented" in tokens:
             issues.append("fragmented_experience")
             score -= 0.1
             
@@ -541,19 +769,18 @@ class VPOfDesignAgent:
             "assessment": "Good consistency and coherence"
         }
     
-    def _review_scalability_maintainability(self, prompt: str, design_review: Dict) -> Dict[str, Any]:
+    def _review_scalability_maintainability(self, tokens: FrozenSet[str], design_review: Dict) -> Dict[str, Any]:
         """Review scalability and maintainability"""
-        prompt_lower = prompt.lower()
         
         score = 0.7
         
-        if "scalable" in prompt_lower:
+        if "scalable" in tokens:
             score += 0.1
             
-        if "maintainable" in prompt_lower:
+        if "maintainable" in tokens:
             score += 0.1
             
-        if "modular" in prompt_lower:
+        if "modular" in tokens:
             score += 0.1
             
         return {
@@ -561,21 +788,20 @@ class VPOfDesignAgent:
             "assessment": "Moderate scalability and maintainability"
         }
     
-    def _assess_accessibility_inclusivity(self, prompt: str, design_review: Dict) -> Dict[str, Any]:
+    def _assess_accessibility_inclusivity(self, tokens: FrozenSet[str], design_review: Dict) -> Dict[str, Any]:
         """Assess accessibility and inclusivity"""
-        prompt_lower = prompt.lower()
         
         compliance_level = "basic"
         score = 0.6
         
-        if "accessibility" in prompt_lower:
+        if "accessibility" in tokens:
             compliance_level = "comprehensive"
             score += 0.2
             
-        if "inclusive" in prompt_lower:
+        if "inclusive" in tokens:
             score += 0.1
             
-        if "wcag" in prompt_lower:
+        if "wcag" in tokens:
             score += 0.1
             
         return {
@@ -586,18 +812,15 @@ class VPOfDesignAgent:
     
     def _calculate_health_score(self, system_maturity: Dict, consistency_coherence: Dict, scalability_maintainability: Dict, accessibility_inclusivity: Dict) -> float:
         """Calculate overall health score"""
-        scores = [
-            consistency_coherence.get("score", 0.0),
-            scalability_maintainability.get("score", 0.0),
-            accessibility_inclusivity.get("score", 0.0)
-        ]
-        
         # Boost for higher maturity levels
-        maturity_boost = {"managed": 0.1, "defined": 0.05, "repeatable": 0.0, "ad_hoc": -0.1}
-        maturity_level = system_maturity.get("level", "repeatable")
-        scores.append(0.7 + maturity_boost.get(maturity_level, 0.0))
-        
-        return sum(scores) / len(scores)
+        maturity_score = 0.7 + _MATURITY_BOOST.get(system_maturity.get("level", "repeatable"), 0.0)
+        
+        return (
+            consistency_coherence.get("score", 0.0)
+            + scalability_maintainability.get("score", 0.0)
+            + accessibility_inclusivity.get("score", 0.0)
+            + maturity_score
+        ) / 4
     
     def _identify_health_improvements(self, system_maturity: Dict, consistency_coherence: Dict, scalability_maintainability: Dict, accessibility_inclusivity: Dict) -> List[str]:
         """Identify health improvements"""
@@ -614,69 +837,33 @@ class VPOfDesignAgent:
             
         return improvements
     
-    def _analyze_engineering_impact(self, prompt: str, design_review: Dict) -> Dict[str, Any]:
+    def _analyze_engineering_impact(self, prompt: str, design_review: Dict) -> Mapping[str, Any]:
         """Analyze impact on engineering"""
-        return {
-            "development_velocity": "improved",
-            "code_quality": "enhanced",
-            "technical_debt": "reduced",
-            "assessment": "Positive impact on engineering efficiency"
-        }
+        return _ENGINEERING_IMPACT
     
-    def _assess_product_impact(self, prompt: str, design_review: Dict) -> Dict[str, Any]:
+    def _assess_product_impact(self, prompt: str, design_review: Dict) -> Mapping[str, Any]:
         """Assess impact on product"""
-        return {
-            "feature_adoption": "increased",
-            "user_satisfaction": "improved",
-            "business_metrics": "positive",
-            "assessment": "Strong positive impact on product metrics"
-        }
+        return _PRODUCT_IMPACT
     
-    def _review_marketing_impact(self, prompt: str, design_review: Dict) -> Dict[str, Any]:
+    def _review_marketing_impact(self, prompt: str, design_review: Dict) -> Mapping[str, Any]:
         """Review impact on marketing"""
-        return {
-            "brand_consistency": "maintained",
-            "user_acquisition": "improved",
-            "conversion_rates": "enhanced",
-            "assessment": "Good alignment with marketing objectives"
-        }
+        return _MARKETING_IMPACT
     
-    def _evaluate_customer_support_impact(self, prompt: str, design_review: Dict) -> Dict[str, Any]:
+    def _evaluate_customer_support_impact(self, prompt: str, design_review: Dict) -> Mapping[str, Any]:
         """Evaluate impact on customer support"""
-        return {
-            "user_onboarding": "simplified",
-            "support_efficiency": "improved",
-            "customer_satisfaction": "enhanced",
-            "assessment": "Reduced support burden through better UX"
-        }
+        return _CUSTOMER_SUPPORT_IMPACT
     
-    def _calculate_overall_impact(self, engineering_impact: Dict, product_impact: Dict, marketing_impact: Dict, customer_support_impact: Dict) -> Dict[str, Any]:
+    def _calculate_overall_impact(self, engineering_impact: Dict, product_impact: Dict, marketing_impact: Dict, customer_support_impact: Dict) -> Mapping[str, Any]:
         """Calculate overall cross-functional impact"""
-        return {
-            "score": 0.85,
-            "assessment": "Strong positive impact across all functions",
-            "summary": "Design decisions are well-aligned with cross-functional objectives"
-        }
+        return _OVERALL_IMPACT
     
-    def _generate_collaboration_recommendations(self, engineering_impact: Dict, product_impact: Dict, marketing_impact: Dict, customer_support_impact: Dict) -> List[str]:
+    def _generate_collaboration_recommendations(self, engineering_impact: Dict, product_impact: Dict, marketing_impact: Dict, customer_support_impact: Dict) -> Sequence[str]:
         """Generate collaboration recommendations"""
-        return [
-            "Establish regular design-engineering sync meetings",
-            "Create shared success metrics across functions",
-            "Implement cross-functional design reviews",
-            "Develop shared design system governance"
-        ]
+        return _COLLABORATION_RECOMMENDATIONS
     
     def _generate_quality_assessment(self, score: float) -> str:
         """Generate quality assessment based on score"""
-        if score >= 0.9:
-            return "Excellent design quality"
-        elif score >= 0.8:
-            return "Good design quality"
-        elif score >= 0.7:
-            return "Satisfactory design quality"
-        else:
-            return "Needs improvement in design quality"
+        return _QUALITY_LABELS[bisect.bisect_right(_QUALITY_THRESHOLDS, score)]
     
     def _calculate_confidence(self, design_review: Dict, vision_alignment: Dict, system_health_critique: Dict) -> float:
         """Calculate confidence score"""
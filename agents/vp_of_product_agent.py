@@ -5,10 +5,206 @@ Acts as a product exec prioritizing business goals, aligning design/tech tradeof
 """
 
 import asyncio
+import hashlib
 import time
 import logging
-from typing import Dict, Any, List, Optional
-from datetime import datetime
+import re
+from collections import OrderedDict
+from typing import Dict, Any, FrozenSet, List, Tuple
+
+from .result_copy import copy_result
+
+_LOGGER = logging.getLogger(__name__)
+
+# Prompts at least this long have their keyword scans run off the event loop
+_OFFLOAD_MIN_PROMPT_LENGTH = 64 * 1024
+
+# Number of prompt reviews kept by VPOfProductAgent._cached_review
+_RESULT_CACHE_SIZE = 256
+
+# Every keyword the analysis helpers probe the prompt for
+_KEYWORDS = (
+    "revenue", "growth", "user", "customer", "market", "expansion",
+    "efficiency", "optimization", "innovation",
+    "feasible", "realistic", "resources", "team",
+    "design", "tech", "quality", "speed", "cost", "user experience",
+    "technology", "performance", "infrastructure",
+    "competitive", "business model", "budget", "timeline", "complex",
+    "product", "high impact"
+)
+
+# Zero-width lookahead so overlapping keywords are all found in one pass;
+# longer keywords are tried first so each position reports its longest match
+_KEYWORD_RE = re.compile("(?=(%s))" % "|".join(map(re.escape, sorted(_KEYWORDS, key=len, reverse=True))))
+
+# A match also implies every keyword it contains (e.g. "technology" -> "tech")
+_KEYWORD_CLOSURE = {keyword: frozenset(k for k in _KEYWORDS if k in keyword) for keyword in _KEYWORDS}
+
+# Product leadership principles
+_PRODUCT_LEADERSHIP_PRINCIPLES = {
+    "business_alignment": ["revenue_growth", "market_expansion", "customer_satisfaction"],
+    "strategic_prioritization": ["impact_assessment", "resource_allocation", "risk_management"],
+    "cross_functional_coordination": ["design_tech_alignment", "stakeholder_management", "execution_planning"],
+    "data_driven_decisions": ["metrics_analysis", "user_research", "market_insights"],
+    "execution_excellence": ["roadmap_feasibility", "delivery_timeline", "quality_assurance"]
+}
+
+# Business goal categories
+_BUSINESS_GOAL_CATEGORIES = {
+    "revenue": ["user_acquisition", "conversion_optimization", "retention_improvement", "pricing_strategy"],
+    "growth": ["market_expansion", "product_launches", "partnership_development", "international_expansion"],
+    "efficiency": ["cost_reduction", "process_optimization", "automation_implementation", "resource_optimization"],
+    "innovation": ["product_innovation", "technology_advancement", "competitive_differentiation", "market_leadership"]
+}
+
+# Design-tech tradeoff factors
+_DESIGN_TECH_TRADEOFFS = {
+    "user_experience": ["design_quality", "performance_impact", "development_complexity"],
+    "time_to_market": ["feature_completeness", "development_speed", "quality_standards"],
+    "technical_debt": ["code_quality", "maintenance_cost", "scalability_requirements"],
+    "resource_allocation": ["team_capacity", "skill_requirements", "budget_constraints"]
+}
+
+# Roadmap feasibility factors
+_ROADMAP_FEASIBILITY_FACTORS = {
+    "technical_feasibility": ["technology_readiness", "team_expertise", "infrastructure_requirements"],
+    "business_feasibility": ["market_demand", "competitive_landscape", "business_model_viability"],
+    "resource_feasibility": ["team_capacity", "budget_availability", "timeline_realism"],
+    "risk_assessment": ["technical_risks", "market_risks", "execution_risks"]
+}
+
+# Impact measurement metrics
+_IMPACT_METRICS = {
+    "user_metrics": ["user_acquisition", "user_retention", "user_satisfaction", "user_engagement"],
+    "business_metrics": ["revenue_growth", "market_share", "customer_lifetime_value", "profit_margins"],
+    "product_metrics": ["feature_adoption", "performance_indicators", "quality_metrics", "technical_health"],
+    "team_metrics": ["delivery_velocity", "team_satisfaction", "cross_functional_collaboration", "innovation_rate"]
+}
+
+# Success metrics tracked for each matched focus; immutable, so shared by every result
+_USER_SUCCESS_METRICS = ("user_acquisition", "user_retention", "user_satisfaction")
+_BUSINESS_SUCCESS_METRICS = ("revenue_growth", "market_share")
+_PRODUCT_SUCCESS_METRICS = ("feature_adoption", "performance_indicators")
+
+# Roadmap risk levels and their feasibility adjustments, indexed by "level_idx"
+_RISK_LEVELS = ("low", "medium", "high")
+_RISK_ADJUSTMENTS = (0.0, -0.05, -0.1)
+
+# Shared read-only default for nested lookups that may be missing
+_EMPTY: Dict[str, Any] = {}
+
+def _join_or(section: Dict[str, Any], *path: str, default: str = "None identified") -> str:
+    """Join the list found by walking path from section with ", ", or return default if any step is missing"""
+    value = section
+    for key in path:
+        value = value.get(key)
+        if value is None:
+            return default
+    return ", ".join(value)
+
+# Markdown layout of the executive analysis, filled by VPOfProductAgent._flatten_output
+_ENHANCED_OUTPUT_TEMPLATE = """# VP of Product Executive Analysis
+
+## Original Request
+{prompt}
+
+## Business Goals Prioritization
+
+### Identified Business Objectives
+{business_objectives}
+
+### Goal Priorities
+**Priority Level:** {priority_level}
+**Focus Areas:** {focus_areas}
+
+### Goal Feasibility
+**Score:** {goal_feasibility_score:.2f}/1.00
+**Assessment:** {goal_feasibility_assessment}
+
+### Priority Goals
+{priority_goals}
+
+### Strategic Recommendations
+{strategic_recommendations}
+
+## Design-Tech Tradeoff Alignment
+
+### Alignment Score
+**Score:** {alignment_score:.2f}/1.00
+
+### Tradeoff Requirements
+{tradeoff_requirements}
+
+### Design-Tech Balance
+**Balance:** {design_tech_balance}
+**Assessment:** {balance_assessment}
+
+### Alignment Recommendations
+{alignment_recommendations}
+
+### Optimization Opportunities
+{optimization_opportunities}
+
+## Roadmap Feasibility Assessment
+
+### Overall Feasibility Score
+**Score:** {feasibility_score:.2f}/1.00
+
+### Technical Feasibility
+**Score:** {technical_feasibility_score:.2f}/1.00
+**Assessment:** {technical_feasibility_assessment}
+
+### Business Feasibility
+**Score:** {business_feasibility_score:.2f}/1.00
+**Assessment:** {business_feasibility_assessment}
+
+### Resource Feasibility
+**Score:** {resource_feasibility_score:.2f}/1.00
+**Assessment:** {resource_feasibility_assessment}
+
+### Risk Assessment
+**Risk Level:** {risk_level}
+**Key Risks:** {key_risks}
+**Mitigation Strategies:** {mitigation_strategies}
+
+### Feasibility Recommendations
+{feasibility_recommendations}
+
+## Impact Assessment & Success Metrics
+
+### Overall Impact Score
+**Score:** {overall_impact_score:.2f}/1.00
+
+### Success Metrics
+**User Metrics:** {user_metrics}
+**Business Metrics:** {business_metrics}
+**Product Metrics:** {product_metrics}
+
+### Expected Impact
+**User Impact:** {user_impact}
+**Business Impact:** {business_impact}
+**Market Impact:** {market_impact}
+
+### Measurement Approach
+**Approach:** {measurement_approach}
+**Timeline:** {measurement_timeline}
+
+### Impact Recommendations
+{impact_recommendations}
+
+## Executive Confidence
+**Score:** {confidence:.2f}/1.00
+
+*Generated by Fusion v14 VP of Product Agent*"""
+
+# The template split into blank-line separated sections, each paired with the
+# list field it consists of (a "### Heading" followed only by that field) or None
+_LIST_SECTION_RE = re.compile(r"### [^\n]+\n\{(\w+)\}")
+_ENHANCED_OUTPUT_SECTIONS = tuple(
+    (match.group(1) if match else None, section)
+    for section in _ENHANCED_OUTPUT_TEMPLATE.split("\n\n")
+    for match in (_LIST_SECTION_RE.fullmatch(section),)
+)
 
 class VPOfProductAgent:
     """
@@ -16,116 +212,134 @@ class VPOfProductAgent:
     Acts as a product exec prioritizing business goals, aligning design/tech tradeoffs, and ensuring roadmap feasibility and impact
     """
     
-    def __init__(self):
-        self.logger = logging.getLogger("VPOfProductAgent")
-        
-        # Product leadership principles
-        self.product_leadership_principles = {
-            "business_alignment": ["revenue_growth", "market_expansion", "customer_satisfaction"],
-            "strategic_prioritization": ["impact_assessment", "resource_allocation", "risk_management"],
-            "cross_functional_coordination": ["design_tech_alignment", "stakeholder_management", "execution_planning"],
-            "data_driven_decisions": ["metrics_analysis", "user_research", "market_insights"],
-            "execution_excellence": ["roadmap_feasibility", "delivery_timeline", "quality_assurance"]
-        }
-        
-        # Business goal categories
-        self.business_goal_categories = {
-            "revenue": ["user_acquisition", "conversion_optimization", "retention_improvement", "pricing_strategy"],
-            "growth": ["market_expansion", "product_launches", "partnership_development", "international_expansion"],
-            "efficiency": ["cost_reduction", "process_optimization", "automation_implementation", "resource_optimization"],
-            "innovation": ["product_innovation", "technology_advancement", "competitive_differentiation", "market_leadership"]
-        }
-        
-        # Design-tech tradeoff factors
-        self.design_tech_tradeoffs = {
-            "user_experience": ["design_quality", "performance_impact", "development_complexity"],
-            "time_to_market": ["feature_completeness", "development_speed", "quality_standards"],
-            "technical_debt": ["code_quality", "maintenance_cost", "scalability_requirements"],
-            "resource_allocation": ["team_capacity", "skill_requirements", "budget_constraints"]
-        }
-        
-        # Roadmap feasibility factors
-        self.roadmap_feasibility_factors = {
-            "technical_feasibility": ["technology_readiness", "team_expertise", "infrastructure_requirements"],
-            "business_feasibility": ["market_demand", "competitive_landscape", "business_model_viability"],
-            "resource_feasibility": ["team_capacity", "budget_availability", "timeline_realism"],
-            "risk_assessment": ["technical_risks", "market_risks", "execution_risks"]
-        }
-        
-        # Impact measurement metrics
-        self.impact_metrics = {
-            "user_metrics": ["user_acquisition", "user_retention", "user_satisfaction", "user_engagement"],
-            "business_metrics": ["revenue_growth", "market_share", "customer_lifetime_value", "profit_margins"],
-            "product_metrics": ["feature_adoption", "performance_indicators", "quality_metrics", "technical_health"],
-            "team_metrics": ["delivery_velocity", "team_satisfaction", "cross_functional_collaboration", "innovation_rate"]
-        }
-        
+    # Stateless: no per-instance __dict__
+    __slots__ = ()
+    
+    # Taxonomies are shared by every instance rather than rebuilt per agent
+    product_leadership_principles = _PRODUCT_LEADERSHIP_PRINCIPLES
+    business_goal_categories = _BUSINESS_GOAL_CATEGORIES
+    design_tech_tradeoffs = _DESIGN_TECH_TRADEOFFS
+    roadmap_feasibility_factors = _ROADMAP_FEASIBILITY_FACTORS
+    impact_metrics = _IMPACT_METRICS
+    
+    # Reviews of recent prompts keyed by prompt digest, shared by every instance (LRU order)
+    _result_cache: "OrderedDict[bytes, Dict[str, Any]]" = OrderedDict()
+    
     async def run_async(self, prompt: str, context: Dict[str, Any]) -> Dict[str, Any]:
         """
         Main async execution method for VP of Product Agent
         """
         start_time = time.time()
-        self.logger.info("VP of Product Agent starting analysis")
+        _LOGGER.info("VP of Product Agent starting analysis")
         
         try:
-            # Prioritize business goals
-            business_goals_analysis = await self._prioritize_business_goals(prompt)
-            
-            # Align design-tech tradeoffs
-            design_tech_alignment = await self._align_design_tech_tradeoffs(prompt, business_goals_analysis)
-            
-            # Ensure roadmap feasibility
-            roadmap_feasibility = await self._ensure_roadmap_feasibility(prompt, business_goals_analysis, design_tech_alignment)
-            
-            # Assess impact and success metrics
-            impact_assessment = await self._assess_impact_and_success(prompt, business_goals_analysis, design_tech_alignment, roadmap_feasibility)
-            
-            # Create enhanced output
-            enhanced_output = await self._create_enhanced_output(prompt, business_goals_analysis, design_tech_alignment, roadmap_feasibility, impact_assessment)
+            review = await self._cached_review(prompt)
             
             execution_time = time.time() - start_time
-            confidence = self._calculate_confidence(business_goals_analysis, design_tech_alignment, roadmap_feasibility)
             
-            self.logger.info(f"VP of Product Agent completed in {execution_time:.2f}s")
+            _LOGGER.info("VP of Product Agent completed in %.2fs", execution_time)
             
             return {
-                "output": enhanced_output,
-                "enhanced_output": enhanced_output,
-                "confidence": confidence,
-                "business_goals_analysis": business_goals_analysis,
-                "design_tech_alignment": design_tech_alignment,
-                "roadmap_feasibility": roadmap_feasibility,
-                "impact_assessment": impact_assessment,
+                **review,
                 "execution_time": execution_time,
                 "shared_state": {
-                    "priority_goals": len(business_goals_analysis.get("priority_goals", [])),
-                    "alignment_score": design_tech_alignment.get("alignment_score"),
-                    "feasibility_score": roadmap_feasibility.get("feasibility_score"),
-                    "impact_score": impact_assessment.get("overall_impact_score"),
-                    "analysis_timestamp": datetime.now().timestamp()
+                    **review["shared_state"],
+                    "analysis_timestamp": time.time()
                 }
             }
             
         except Exception as e:
             execution_time = time.time() - start_time
-            self.logger.error(f"VP of Product Agent failed: {e}")
+            _LOGGER.error("VP of Product Agent failed: %s", e)
             return {
                 "error": str(e),
                 "confidence": 0.0,
                 "execution_time": execution_time
             }
     
-    async def _prioritize_business_goals(self, prompt: str) -> Dict[str, Any]:
+    async def _cached_review(self, prompt: str) -> Dict[str, Any]:
+        """Return the review for a prompt, reusing the result of an identical earlier prompt.
+        Each caller gets its own copy, so the cached review is never handed out"""
+        key = hashlib.blake2b(prompt.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+        cache = VPOfProductAgent._result_cache
+        
+        review = cache.get(key)
+        if review is None:
+            review = await self._review(prompt)
+            cache[key] = review
+            if len(cache) > _RESULT_CACHE_SIZE:
+                cache.popitem(last=False)
+        else:
+            cache.move_to_end(key)
+        return copy_result(review)
+    
+    async def _review(self, prompt: str) -> Dict[str, Any]:
+        """Run the full analysis pipeline; everything except timing depends only on the prompt"""
+        
+        # Scan the prompt for keywords once
+        tokens = await self._scan(self._extract_tokens, prompt)
+        
+        business_goals_analysis, design_tech_alignment, roadmap_feasibility, impact_assessment = await self._analyze(tokens)
+        
+        confidence = self._calculate_confidence(business_goals_analysis, design_tech_alignment, roadmap_feasibility)
+        
+        # Create enhanced output
+        enhanced_output = await self._create_enhanced_output(prompt, business_goals_analysis, design_tech_alignment, roadmap_feasibility, impact_assessment, confidence)
+        
+        return {
+            "output": enhanced_output,
+            "confidence": confidence,
+            "business_goals_analysis": business_goals_analysis,
+            "design_tech_alignment": design_tech_alignment,
+            "roadmap_feasibility": roadmap_feasibility,
+            "impact_assessment": impact_assessment,
+            "shared_state": {
+                "priority_goals": len(business_goals_analysis.get("priority_goals", [])),
+                "alignment_score": design_tech_alignment.get("alignment_score"),
+                "feasibility_score": roadmap_feasibility.get("feasibility_score"),
+                "impact_score": impact_assessment.get("overall_impact_score")
+            }
+        }
+    
+    async def _analyze(self, tokens: FrozenSet[str]) -> Tuple[Dict[str, Any], Dict[str, Any], Dict[str, Any], Dict[str, Any]]:
+        """Run the four analysis phases for a keyword set"""
+        
+        # Prioritize business goals, align design-tech tradeoffs, ensure roadmap
+        # feasibility and assess impact concurrently; each phase only needs the keywords
+        results = await asyncio.gather(
+            self._prioritize_business_goals(tokens),
+            self._align_design_tech_tradeoffs(tokens),
+            self._ensure_roadmap_feasibility(tokens),
+            self._assess_impact_and_success(tokens),
+            return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+        return tuple(results)
+    
+    async def run_batch_async(self, prompts: List[str], context: Dict[str, Any], concurrency: int = 16) -> List[Dict[str, Any]]:
+        """Run a batch of prompts concurrently, bounded by a semaphore"""
+        
+        semaphore = asyncio.Semaphore(concurrency)
+        return await asyncio.gather(*[self._bounded(semaphore, prompt, context) for prompt in prompts])
+    
+    async def _bounded(self, semaphore: asyncio.Semaphore, prompt: str, context: Dict[str, Any]) -> Dict[str, Any]:
+        """Run a single prompt once a batch slot is available"""
+        async with semaphore:
+            return await self.run_async(prompt, context)
+    
+    async def _prioritize_business_goals(self, tokens: FrozenSet[str]) -> Dict[str, Any]:
         """Prioritize business goals based on strategic context"""
         
         # Identify business objectives
-        business_objectives = self._identify_business_objectives(prompt)
+        business_objectives = self._identify_business_objectives(tokens)
         
         # Assess goal priorities
-        goal_priorities = self._assess_goal_priorities(prompt, business_objectives)
+        goal_priorities = self._assess_goal_priorities(tokens, business_objectives)
         
         # Evaluate goal feasibility
-        goal_feasibility = self._evaluate_goal_feasibility(prompt, business_objectives)
+        goal_feasibility = self._evaluate_goal_feasibility(tokens, business_objectives)
         
         # Generate priority recommendations
         priority_recommendations = self._generate_priority_recommendations(business_objectives, goal_priorities, goal_feasibility)
@@ -138,14 +352,14 @@ class VPOfProductAgent:
             "strategic_recommendations": self._generate_strategic_recommendations(business_objectives, goal_priorities)
         }
     
-    async def _align_design_tech_tradeoffs(self, prompt: str, business_goals_analysis: Dict) -> Dict[str, Any]:
+    async def _align_design_tech_tradeoffs(self, tokens: FrozenSet[str]) -> Dict[str, Any]:
         """Align design and technology tradeoffs"""
         
         # Analyze tradeoff requirements
-        tradeoff_requirements = self._analyze_tradeoff_requirements(prompt, business_goals_analysis)
+        tradeoff_requirements = self._analyze_tradeoff_requirements(tokens)
         
         # Evaluate design-tech balance
-        design_tech_balance = self._evaluate_design_tech_balance(prompt, tradeoff_requirements)
+        design_tech_balance = self._evaluate_design_tech_balance(tokens, tradeoff_requirements)
         
         # Generate alignment recommendations
         alignment_recommendations = self._generate_alignment_recommendations(tradeoff_requirements, design_tech_balance)
@@ -161,20 +375,20 @@ class VPOfProductAgent:
             "optimization_opportunities": self._identify_optimization_opportunities(tradeoff_requirements, design_tech_balance)
         }
     
-    async def _ensure_roadmap_feasibility(self, prompt: str, business_goals_analysis: Dict, design_tech_alignment: Dict) -> Dict[str, Any]:
+    async def _ensure_roadmap_feasibility(self, tokens: FrozenSet[str]) -> Dict[str, Any]:
         """Ensure roadmap feasibility and execution capability"""
         
         # Assess technical feasibility
-        technical_feasibility = self._assess_technical_feasibility(prompt, business_goals_analysis, design_tech_alignment)
+        technical_feasibility = self._assess_technical_feasibility(tokens)
         
         # Evaluate business feasibility
-        business_feasibility = self._evaluate_business_feasibility(prompt, business_goals_analysis, design_tech_alignment)
+        business_feasibility = self._evaluate_business_feasibility(tokens)
         
         # Review resource feasibility
-        resource_feasibility = self._review_resource_feasibility(prompt, business_goals_analysis, design_tech_alignment)
+        resource_feasibility = self._review_resource_feasibility(tokens)
         
         # Assess risks and mitigation
-        risk_assessment = self._assess_roadmap_risks(prompt, business_goals_analysis, design_tech_alignment)
+        risk_assessment = self._assess_roadmap_risks(tokens)
         
         # Calculate overall feasibility score
         feasibility_score = self._calculate_feasibility_score(technical_feasibility, business_feasibility, resource_feasibility, risk_assessment)
@@ -188,17 +402,17 @@ class VPOfProductAgent:
             "feasibility_recommendations": self._generate_feasibility_recommendations(technical_feasibility, business_feasibility, resource_feasibility, risk_assessment)
         }
     
-    async def _assess_impact_and_success(self, prompt: str, business_goals_analysis: Dict, design_tech_alignment: Dict, roadmap_feasibility: Dict) -> Dict[str, Any]:
+    async def _assess_impact_and_success(self, tokens: FrozenSet[str]) -> Dict[str, Any]:
         """Assess impact and define success metrics"""
         
         # Define success metrics
-        success_metrics = self._define_success_metrics(prompt, business_goals_analysis)
+        success_metrics = self._define_success_metrics(tokens)
         
         # Assess expected impact
-        expected_impact = self._assess_expected_impact(prompt, business_goals_analysis, design_tech_alignment)
+        expected_impact = self._assess_expected_impact(tokens)
         
         # Evaluate measurement approach
-        measurement_approach = self._evaluate_measurement_approach(prompt, success_metrics, expected_impact)
+        measurement_approach = self._evaluate_measurement_approach(tokens, success_metrics, expected_impact)
         
         # Calculate overall impact score
         overall_impact_score = self._calculate_impact_score(success_metrics, expected_impact, measurement_approach)
@@ -211,140 +425,104 @@ class VPOfProductAgent:
             "impact_recommendations": self._generate_impact_recommendations(success_metrics, expected_impact, measurement_approach)
         }
     
-    async def _create_enhanced_output(self, prompt: str, business_goals_analysis: Dict, design_tech_alignment: Dict, roadmap_feasibility: Dict, impact_assessment: Dict) -> str:
+    async def _scan(self, helper, prompt: str):
+        """Run a synchronous prompt scan, in a worker thread when the prompt is large enough to stall the event loop"""
+        if len(prompt) < _OFFLOAD_MIN_PROMPT_LENGTH:
+            return helper(prompt)
+        return await asyncio.get_running_loop().run_in_executor(None, helper, prompt)
+    
+    def _extract_tokens(self, prompt: str) -> FrozenSet[str]:
+        """Return every known keyword contained in the prompt; the only place it is lowercased"""
+        matches = set(_KEYWORD_RE.findall(prompt.lower()))
+        return frozenset().union(*(_KEYWORD_CLOSURE[match] for match in matches))
+    
+    async def _create_enhanced_output(self, prompt: str, business_goals_analysis: Dict, design_tech_alignment: Dict, roadmap_feasibility: Dict, impact_assessment: Dict, confidence: float) -> str:
         """Create enhanced output with executive product perspective"""
         
-        return f"""# VP of Product Executive Analysis
-
-## Original Request
-{prompt}
-
-## Business Goals Prioritization
-
-### Identified Business Objectives
-{', '.join(business_goals_analysis.get('business_objectives', ['None identified']))}
-
-### Goal Priorities
-**Priority Level:** {business_goals_analysis.get('goal_priorities', {}).get('level', 'unknown')}
-**Focus Areas:** {', '.join(business_goals_analysis.get('goal_priorities', {}).get('focus_areas', ['None identified']))}
-
-### Goal Feasibility
-**Score:** {business_goals_analysis.get('goal_feasibility', {}).get('score', 0):.2f}/1.00
-**Assessment:** {business_goals_analysis.get('goal_feasibility', {}).get('assessment', 'Not assessed')}
-
-### Priority Goals
-{', '.join(business_goals_analysis.get('priority_goals', ['None identified']))}
-
-### Strategic Recommendations
-{', '.join(business_goals_analysis.get('strategic_recommendations', ['None provided']))}
-
-## Design-Tech Tradeoff Alignment
-
-### Alignment Score
-**Score:** {design_tech_alignment.get('alignment_score', 0):.2f}/1.00
-
-### Tradeoff Requirements
-{', '.join(design_tech_alignment.get('tradeoff_requirements', {}).get('requirements', ['None identified']))}
-
-### Design-Tech Balance
-**Balance:** {design_tech_alignment.get('design_tech_balance', {}).get('balance', 'unknown')}
-**Assessment:** {design_tech_alignment.get('design_tech_balance', {}).get('assessment', 'Not assessed')}
-
-### Alignment Recommendations
-{', '.join(design_tech_alignment.get('alignment_recommendations', ['None provided']))}
-
-### Optimization Opportunities
-{', '.join(design_tech_alignment.get('optimization_opportunities', ['None identified']))}
-
-## Roadmap Feasibility Assessment
-
-### Overall Feasibility Score
-**Score:** {roadmap_feasibility.get('feasibility_score', 0):.2f}/1.00
-
-### Technical Feasibility
-**Score:** {roadmap_feasibility.get('technical_feasibility', {}).get('score', 0):.2f}/1.00
-**Assessment:** {roadmap_feasibility.get('technical_feasibility', {}).get('assessment', 'Not assessed')}
-
-### Business Feasibility
-**Score:** {roadmap_feasibility.get('business_feasibility', {}).get('score', 0):.2f}/1.00
-**Assessment:** {roadmap_feasibility.get('business_feasibility', {}).get('assessment', 'Not assessed')}
-
-### Resource Feasibility
-**Score:** {roadmap_feasibility.get('resource_feasibility', {}).get('score', 0):.2f}/1.00
-**Assessment:** {roadmap_feasibility.get('resource_feasibility', {}).get('assessment', 'Not assessed')}
-
-### Risk Assessment
-**Risk Level:** {roadmap_feasibility.get('risk_assessment', {}).get('level', 'unknown')}
-**Key Risks:** {', '.join(roadmap_feasibility.get('risk_assessment', {}).get('key_risks', ['None identified']))}
-**Mitigation Strategies:** {', '.join(roadmap_feasibility.get('risk_assessment', {}).get('mitigation_strategies', ['None identified']))}
-
-### Feasibility Recommendations
-{', '.join(roadmap_feasibility.get('feasibility_recommendations', ['None provided']))}
-
-## Impact Assessment & Success Metrics
-
-### Overall Impact Score
-**Score:** {impact_assessment.get('overall_impact_score', 0):.2f}/1.00
-
-### Success Metrics
-**User Metrics:** {', '.join(impact_assessment.get('success_metrics', {}).get('user_metrics', ['None defined']))}
-**Business Metrics:** {', '.join(impact_assessment.get('success_metrics', {}).get('business_metrics', ['None defined']))}
-**Product Metrics:** {', '.join(impact_assessment.get('success_metrics', {}).get('product_metrics', ['None defined']))}
-
-### Expected Impact
-**User Impact:** {impact_assessment.get('expected_impact', {}).get('user_impact', 'Not assessed')}
-**Business Impact:** {impact_assessment.get('expected_impact', {}).get('business_impact', 'Not assessed')}
-**Market Impact:** {impact_assessment.get('expected_impact', {}).get('market_impact', 'Not assessed')}
-
-### Measurement Approach
-**Approach:** {impact_assessment.get('measurement_approach', {}).get('approach', 'Not defined')}
-**Timeline:** {impact_assessment.get('measurement_approach', {}).get('timeline', 'Not defined')}
-
-### Impact Recommendations
-{', '.join(impact_assessment.get('impact_recommendations', ['None provided']))}
-
-## Executive Confidence
-**Score:** {self._calculate_confidence(business_goals_analysis, design_tech_alignment, roadmap_feasibility):.2f}/1.00
-
-*Generated by Fusion v14 VP of Product Agent*"""
+        fields = self._flatten_output(prompt, business_goals_analysis, design_tech_alignment, roadmap_feasibility, impact_assessment, confidence)
+        
+        # Leave out list-only sections whose list came back empty
+        return "\n\n".join(
+            section.format_map(fields)
+            for list_field, section in _ENHANCED_OUTPUT_SECTIONS
+            if list_field is None or fields[list_field]
+        )
+    
+    def _flatten_output(self, prompt: str, business_goals_analysis: Dict, design_tech_alignment: Dict, roadmap_feasibility: Dict, impact_assessment: Dict, confidence: float) -> Dict[str, Any]:
+        """Collect every field of the enhanced output template into a flat dict"""
+        
+        return {
+            "prompt": prompt,
+            "business_objectives": _join_or(business_goals_analysis, "business_objectives"),
+            "priority_level": business_goals_analysis.get('goal_priorities', _EMPTY).get('level', 'unknown'),
+            "focus_areas": _join_or(business_goals_analysis, "goal_priorities", "focus_areas"),
+            "goal_feasibility_score": business_goals_analysis.get('goal_feasibility', _EMPTY).get('score', 0),
+            "goal_feasibility_assessment": business_goals_analysis.get('goal_feasibility', _EMPTY).get('assessment', 'Not assessed'),
+            "priority_goals": _join_or(business_goals_analysis, "priority_goals"),
+            "strategic_recommendations": _join_or(business_goals_analysis, "strategic_recommendations", default="None provided"),
+            "alignment_score": design_tech_alignment.get('alignment_score', 0),
+            "tradeoff_requirements": _join_or(design_tech_alignment, "tradeoff_requirements", "requirements"),
+            "design_tech_balance": design_tech_alignment.get('design_tech_balance', _EMPTY).get('balance', 'unknown'),
+            "balance_assessment": design_tech_alignment.get('design_tech_balance', _EMPTY).get('assessment', 'Not assessed'),
+            "alignment_recommendations": _join_or(design_tech_alignment, "alignment_recommendations", default="None provided"),
+            "optimization_opportunities": _join_or(design_tech_alignment, "optimization_opportunities"),
+            "feasibility_score": roadmap_feasibility.get('feasibility_score', 0),
+            "technical_feasibility_score": roadmap_feasibility.get('technical_feasibility', _EMPTY).get('score', 0),
+            "technical_feasibility_assessment": roadmap_feasibility.get('technical_feasibility', _EMPTY).get('assessment', 'Not assessed'),
+            "business_feasibility_score": roadmap_feasibility.get('business_feasibility', _EMPTY).get('score', 0),
+            "business_feasibility_assessment": roadmap_feasibility.get('business_feasibility', _EMPTY).get('assessment', 'Not assessed'),
+            "resource_feasibility_score": roadmap_feasibility.get('resource_feasibility', _EMPTY).get('score', 0),
+            "resource_feasibility_assessment": roadmap_feasibility.get('resource_feasibility', _EMPTY).get('assessment', 'Not assessed'),
+            "risk_level": roadmap_feasibility.get('risk_assessment', _EMPTY).get('level', 'unknown'),
+            "key_risks": _join_or(roadmap_feasibility, "risk_assessment", "key_risks"),
+            "mitigation_strategies": _join_or(roadmap_feasibility, "risk_assessment", "mitigation_strategies"),
+            "feasibility_recommendations": _join_or(roadmap_feasibility, "feasibility_recommendations", default="None provided"),
+            "overall_impact_score": impact_assessment.get('overall_impact_score', 0),
+            "user_metrics": _join_or(impact_assessment, "success_metrics", "user_metrics", default="None defined"),
+            "business_metrics": _join_or(impact_assessment, "success_metrics", "business_metrics", default="None defined"),
+            "product_metrics": _join_or(impact_assessment, "success_metrics", "product_metrics", default="None defined"),
+            "user_impact": impact_assessment.get('expected_impact', _EMPTY).get('user_impact', 'Not assessed'),
+            "business_impact": impact_assessment.get('expected_impact', _EMPTY).get('business_impact', 'Not assessed'),
+            "market_impact": impact_assessment.get('expected_impact', _EMPTY).get('market_impact', 'Not assessed'),
+            "measurement_approach": impact_assessment.get('measurement_approach', _EMPTY).get('approach', 'Not defined'),
+            "measurement_timeline": impact_assessment.get('measurement_approach', _EMPTY).get('timeline', 'Not defined'),
+            "impact_recommendations": _join_or(impact_assessment, "impact_recommendations", default="None provided"),
+            "confidence": confidence
+        }
     
-    def _identify_business_objectives(self, prompt: str) -> List[str]:
+    def _identify_business_objectives(self, tokens: FrozenSet[str]) -> List[str]:
         """Identify business objectives from prompt"""
         objectives = []
-        prompt_lower = prompt.lower()
-        
-        if "revenue" in prompt_lower or "growth" in prompt_lower:
+        if "revenue" in tokens or "growth" in tokens:
             objectives.append("revenue_growth")
             
-        if "user" in prompt_lower or "customer" in prompt_lower:
+        if "user" in tokens or "customer" in tokens:
             objectives.append("user_acquisition")
             
-        if "market" in prompt_lower or "expansion" in prompt_lower:
+        if "market" in tokens or "expansion" in tokens:
             objectives.append("market_expansion")
             
-        if "efficiency" in prompt_lower or "optimization" in prompt_lower:
+        if "efficiency" in tokens or "optimization" in tokens:
             objectives.append("operational_efficiency")
             
-        if "innovation" in prompt_lower:
+        if "innovation" in tokens:
             objectives.append("product_innovation")
             
         return objectives
     
-    def _assess_goal_priorities(self, prompt: str, business_objectives: List[str]) -> Dict[str, Any]:
+    def _assess_goal_priorities(self, tokens: FrozenSet[str], business_objectives: List[str]) -> Dict[str, Any]:
         """Assess goal priorities"""
-        prompt_lower = prompt.lower()
-        
         priority_level = "medium"
         focus_areas = []
         
-        if "revenue" in prompt_lower:
+        if "revenue" in tokens:
             priority_level = "high"
             focus_areas.append("revenue_growth")
             
-        if "user" in prompt_lower:
+        if "user" in tokens:
             focus_areas.append("user_experience")
             
-        if "market" in prompt_lower:
+        if "market" in tokens:
             focus_areas.append("market_positioning")
             
         return {
@@ -353,21 +531,19 @@ class VPOfProductAgent:
             "assessment": f"Goals prioritized at {priority_level} level"
         }
     
-    def _evaluate_goal_feasibility(self, prompt: str, business_objectives: List[str]) -> Dict[str, Any]:
+    def _evaluate_goal_feasibility(self, tokens: FrozenSet[str], business_objectives: List[str]) -> Dict[str, Any]:
         """Evaluate goal feasibility"""
-        prompt_lower = prompt.lower()
-        
         score = 0.7
         factors = []
         
-        if "feasible" in prompt_lower or "realistic" in prompt_lower:
+        if "feasible" in tokens or "realistic" in tokens:
             score += 0.1
             factors.append("realistic_timeline")
             
-        if "resources" in prompt_lower:
+        if "resources" in tokens:
             factors.append("resource_availability")
             
-        if "team" in prompt_lower:
+        if "team" in tokens:
             factors.append("team_capability")
             
         return {
@@ -403,19 +579,17 @@ class VPOfProductAgent:
             
         return recommendations
     
-    def _analyze_tradeoff_requirements(self, prompt: str, business_goals_analysis: Dict) -> Dict[str, Any]:
+    def _analyze_tradeoff_requirements(self, tokens: FrozenSet[str]) -> Dict[str, Any]:
         """Analyze tradeoff requirements"""
-        prompt_lower = prompt.lower()
-        
         requirements = []
         
-        if "design" in prompt_lower and "tech" in prompt_lower:
+        if "design" in tokens and "tech" in tokens:
             requirements.append("design_tech_balance")
             
-        if "quality" in prompt_lower and "speed" in prompt_lower:
+        if "quality" in tokens and "speed" in tokens:
             requirements.append("quality_speed_tradeoff")
             
-        if "cost" in prompt_lower and "quality" in prompt_lower:
+        if "cost" in tokens and "quality" in tokens:
             requirements.append("cost_quality_balance")
             
         return {
@@ -423,18 +597,16 @@ class VPOfProductAgent:
             "assessment": "Tradeoff requirements identified"
         }
     
-    def _evaluate_design_tech_balance(self, prompt: str, tradeoff_requirements: Dict) -> Dict[str, Any]:
+    def _evaluate_design_tech_balance(self, tokens: FrozenSet[str], tradeoff_requirements: Dict) -> Dict[str, Any]:
         """Evaluate design-tech balance"""
-        prompt_lower = prompt.lower()
-        
         balance = "balanced"
         score = 0.7
         
-        if "design" in prompt_lower and "user experience" in prompt_lower:
+        if "design" in tokens and "user experience" in tokens:
             balance = "design_focused"
             score += 0.1
             
-        if "technology" in prompt_lower and "performance" in prompt_lower:
+        if "technology" in tokens and "performance" in tokens:
             balance = "tech_focused"
             score += 0.1
             
@@ -458,14 +630,11 @@ class VPOfProductAgent:
     
     def _calculate_alignment_score(self, tradeoff_requirements: Dict, design_tech_balance: Dict) -> float:
         """Calculate alignment score"""
-        base_score = 0.8
-        
-        if tradeoff_requirements.get("requirements"):
-            base_score += 0.1
-            
-        if design_tech_balance.get("score", 0.0) > 0.7:
-            base_score += 0.05
-            
+        base_score = (
+            0.8
+            + 0.1 * bool(tradeoff_requirements.get("requirements"))
+            + 0.05 * (design_tech_balance.get("score", 0.0) > 0.7)
+        )
         return min(base_score, 1.0)
     
     def _identify_optimization_opportunities(self, tradeoff_requirements: Dict, design_tech_balance: Dict) -> List[str]:
@@ -477,88 +646,81 @@ class VPOfProductAgent:
             
         return opportunities
     
-    def _assess_technical_feasibility(self, prompt: str, business_goals_analysis: Dict, design_tech_alignment: Dict) -> Dict[str, Any]:
+    def _assess_technical_feasibility(self, tokens: FrozenSet[str]) -> Dict[str, Any]:
         """Assess technical feasibility"""
-        prompt_lower = prompt.lower()
-        
         score = 0.7
         factors = []
         
-        if "technology" in prompt_lower:
+        if "technology" in tokens:
             factors.append("technology_readiness")
             
-        if "team" in prompt_lower:
+        if "team" in tokens:
             factors.append("team_expertise")
             
-        if "infrastructure" in prompt_lower:
+        if "infrastructure" in tokens:
             factors.append("infrastructure_requirements")
             
         return {
-            "score": min(score, 1.0),
+            "score": score,
             "factors": factors,
             "assessment": "Moderate technical feasibility"
         }
     
-    def _evaluate_business_feasibility(self, prompt: str, business_goals_analysis: Dict, design_tech_alignment: Dict) -> Dict[str, Any]:
+    def _evaluate_business_feasibility(self, tokens: FrozenSet[str]) -> Dict[str, Any]:
         """Evaluate business feasibility"""
-        prompt_lower = prompt.lower()
-        
         score = 0.8
         factors = []
         
-        if "market" in prompt_lower:
+        if "market" in tokens:
             factors.append("market_demand")
             
-        if "competitive" in prompt_lower:
+        if "competitive" in tokens:
             factors.append("competitive_landscape")
             
-        if "business model" in prompt_lower:
+        if "business model" in tokens:
             factors.append("business_model_viability")
             
         return {
-            "score": min(score, 1.0),
+            "score": score,
             "factors": factors,
             "assessment": "Good business feasibility"
         }
     
-    def _review_resource_feasibility(self, prompt: str, business_goals_analysis: Dict, design_tech_alignment: Dict) -> Dict[str, Any]:
+    def _review_resource_feasibility(self, tokens: FrozenSet[str]) -> Dict[str, Any]:
         """Review resource feasibility"""
-        prompt_lower = prompt.lower()
-        
         score = 0.75
         factors = []
         
-        if "team" in prompt_lower:
+        if "team" in tokens:
             factors.append("team_capacity")
             
-        if "budget" in prompt_lower:
+        if "budget" in tokens:
             factors.append("budget_availability")
             
-        if "timeline" in prompt_lower:
+        if "timeline" in tokens:
             factors.append("timeline_realism")
             
         return {
-            "score": min(score, 1.0),
+            "score": score,
             "factors": factors,
             "assessment": "Good resource feasibility"
         }
     
-    def _assess_roadmap_risks(self, prompt: str, business_goals_analysis: Dict, design_tech_alignment: Dict) -> Dict[str, Any]:
+    def _assess_roadmap_risks(self, tokens: FrozenSet[str]) -> Dict[str, Any]:
         """Assess roadmap risks"""
-        prompt_lower = prompt.lower()
-        
         risks = []
-        risk_level = "low"
+        risk_index = 0
         
-        if "complex" in prompt_lower:
+        if "complex" in tokens:
             risks.append("implementation_complexity")
-            risk_level = "medium"
+            risk_index = 1
             
-        if "timeline" in prompt_lower:
+        if "timeline" in tokens:
             risks.append("timeline_pressure")
             
         return {
-            "level": risk_level,
+            "level": _RISK_LEVELS[risk_index],
+            "level_idx": risk_index,
             "key_risks": risks,
             "mitigation_strategies": self._generate_risk_mitigation_strategies(risks)
         }
@@ -577,18 +739,14 @@ class VPOfProductAgent:
     
     def _calculate_feasibility_score(self, technical_feasibility: Dict, business_feasibility: Dict, resource_feasibility: Dict, risk_assessment: Dict) -> float:
         """Calculate overall feasibility score"""
-        scores = [
-            technical_feasibility.get("score", 0.0),
-            business_feasibility.get("score", 0.0),
-            resource_feasibility.get("score", 0.0)
-        ]
+        base_score = (
+            technical_feasibility.get("score", 0.0)
+            + business_feasibility.get("score", 0.0)
+            + resource_feasibility.get("score", 0.0)
+        ) / 3
         
         # Adjust for risk level
-        risk_adjustment = {"low": 0.0, "medium": -0.05, "high": -0.1}
-        risk_level = risk_assessment.get("level", "low")
-        
-        base_score = sum(scores) / len(scores)
-        return max(base_score + risk_adjustment.get(risk_level, 0.0), 0.0)
+        return max(base_score + _RISK_ADJUSTMENTS[risk_assessment.get("level_idx", 0)], 0.0)
     
     def _generate_feasibility_recommendations(self, technical_feasibility: Dict, business_feasibility: Dict, resource_feasibility: Dict, risk_assessment: Dict) -> List[str]:
         """Generate feasibility recommendations"""
@@ -605,38 +763,25 @@ class VPOfProductAgent:
             
         return recommendations
     
-    def _define_success_metrics(self, prompt: str, business_goals_analysis: Dict) -> Dict[str, Any]:
+    def _define_success_metrics(self, tokens: FrozenSet[str]) -> Dict[str, Any]:
         """Define success metrics"""
-        prompt_lower = prompt.lower()
-        
-        user_metrics = []
-        business_metrics = []
-        product_metrics = []
+        user_metrics = _USER_SUCCESS_METRICS if "user" in tokens else ()
+        business_metrics = _BUSINESS_SUCCESS_METRICS if "revenue" in tokens else ()
+        product_metrics = _PRODUCT_SUCCESS_METRICS if "product" in tokens else ()
         
-        if "user" in prompt_lower:
-            user_metrics.extend(["user_acquisition", "user_retention", "user_satisfaction"])
-            
-        if "revenue" in prompt_lower:
-            business_metrics.extend(["revenue_growth", "market_share"])
-            
-        if "product" in prompt_lower:
-            product_metrics.extend(["feature_adoption", "performance_indicators"])
-            
         return {
             "user_metrics": user_metrics,
             "business_metrics": business_metrics,
             "product_metrics": product_metrics
         }
     
-    def _assess_expected_impact(self, prompt: str, business_goals_analysis: Dict, design_tech_alignment: Dict) -> Dict[str, Any]:
+    def _assess_expected_impact(self, tokens: FrozenSet[str]) -> Dict[str, Any]:
         """Assess expected impact"""
-        prompt_lower = prompt.lower()
-        
         user_impact = "moderate"
         business_impact = "moderate"
         market_impact = "moderate"
         
-        if "high impact" in prompt_lower:
+        if "high impact" in tokens:
             user_impact = "high"
             business_impact = "high"
             market_impact = "high"
@@ -647,7 +792,7 @@ class VPOfProductAgent:
             "market_impact": market_impact
         }
     
-    def _evaluate_measurement_approach(self, prompt: str, success_metrics: Dict, expected_impact: Dict) -> Dict[str, Any]:
+    def _evaluate_measurement_approach(self, tokens: FrozenSet[str], success_metrics: Dict, expected_impact: Dict) -> Dict[str, Any]:
         """Evaluate measurement approach"""
         return {
             "approach": "comprehensive_metrics_tracking",
@@ -657,17 +802,12 @@ class VPOfProductAgent:
     
     def _calculate_impact_score(self, success_metrics: Dict, expected_impact: Dict, measurement_approach: Dict) -> float:
         """Calculate impact score"""
-        base_score = 0.8
-        
-        if success_metrics.get("user_metrics"):
-            base_score += 0.05
-            
-        if success_metrics.get("business_metrics"):
-            base_score += 0.05
-            
-        if expected_impact.get("user_impact") == "high":
-            base_score += 0.05
-            
+        base_score = (
+            0.8
+            + 0.05 * bool(success_metrics.get("user_metrics"))
+            + 0.05 * bool(success_metrics.get("business_metrics"))
+            + 0.05 * (expected_impact.get("user_impact") == "high")
+        )
         return min(base_score, 1.0)
     
     def _generate_impact_recommendations(self, success_metrics: Dict, expected_impact: Dict, measurement_approach: Dict) -> List[str]:
@@ -684,18 +824,12 @@ class VPOfProductAgent:
     
     def _calculate_confidence(self, business_goals_analysis: Dict, design_tech_alignment: Dict, roadmap_feasibility: Dict) -> float:
         """Calculate confidence score"""
-        base_confidence = 0.8
-        
-        # Boost for clear business objectives
-        if business_goals_analysis.get("business_objectives"):
-            base_confidence += 0.05
-            
-        # Boost for good alignment
-        if design_tech_alignment.get("alignment_score", 0.0) > 0.7:
-            base_confidence += 0.05
-            
-        # Boost for high feasibility
-        if roadmap_feasibility.get("feasibility_score", 0.0) > 0.7:
-            base_confidence += 0.05
-            
-        return min(base_confidence, 0.95)
+        # Base 0.8, boosted for clear business objectives, good alignment and
+        # high feasibility; a missing boost adds 0.0, which leaves the sum exact
+        return min(
+            0.8
+            + 0.05 * bool(business_goals_analysis.get("business_objectives"))
+            + 0.05 * (design_tech_alignment.get("alignment_score", 0.0) > 0.7)
+            + 0.05 * (roadmap_feasibility.get("feasibility_score", 0.0) > 0.7),
+            0.95
+        )
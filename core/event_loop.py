@@ -0,0 +1,14 @@
+"""
+Event Loop - Fusion v14
+Event loop setup shared by the CLI entry points
+"""
+
+import asyncio
+
+def install_uvloop() -> None:
+    """Use uvloop's event loop policy when it is installed; stdlib asyncio otherwise"""
+    try:
+        import uvloop
+    except ImportError:
+        return
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
@@ -5,14 +5,23 @@ Shared state and memory management for the agent OS
 
 import json
 import asyncio
-from typing import Dict, Any, List, Optional
+import sys
+import heapq
+import re
+import time
+from collections import OrderedDict, defaultdict, deque
+from itertools import islice
+from typing import Deque, Dict, Any, FrozenSet, List, Optional, Set, Tuple
 from datetime import datetime
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, fields
 import logging
 
-@dataclass
+# Slotted dataclasses need Python 3.10+; older interpreters keep a __dict__
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(**_SLOTS)
 class MemoryEntry:
-    timestamp: str
+    timestamp_ns: int
     agent_name: str
     input_prompt: str
     output: Dict[str, Any]
@@ -20,6 +29,37 @@ class MemoryEntry:
     tools_used: List[str]
     execution_time: float
     pattern_applied: Optional[str] = None
+    
+    @property
+    def timestamp(self) -> str:
+        """Local ISO 8601 time of the interaction, formatted on demand"""
+        seconds, nanoseconds = divmod(self.timestamp_ns, 1_000_000_000)
+        return datetime.fromtimestamp(seconds).replace(microsecond=nanoseconds // 1000).isoformat()
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Export form of the entry, with the ISO timestamp of older exports"""
+        # Field values are referenced, not deep-copied as asdict() would
+        data = {"timestamp": self.timestamp}
+        for name in _EXPORT_FIELDS:
+            data[name] = getattr(self, name)
+        return data
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "MemoryEntry":
+        """Build an entry from its export form"""
+        data = dict(data)
+        moment = datetime.fromisoformat(data.pop("timestamp"))
+        # Whole seconds and microseconds separately, so no float rounding
+        data["timestamp_ns"] = (int(moment.replace(microsecond=0).timestamp()) * 1_000_000_000
+                                + moment.microsecond * 1000)
+        return cls(**data)
+
+_EXPORT_FIELDS = tuple(field.name for field in fields(MemoryEntry) if field.name != "timestamp_ns")
+
+def _nest_json(text: str, depth: int) -> str:
+    """Indent pretty-printed JSON to sit depth levels deep in an indent=2 document;
+    newlines inside JSON strings are escaped, so every raw newline is structural"""
+    return text.replace("\n", "\n" + "  " * depth)
 
 class FusionContext:
     """
@@ -30,16 +70,46 @@ class FusionContext:
     def __init__(self, config: Dict[str, Any]):
         self.config = config
         self.shared_state: Dict[str, Any] = {}
-        self.memory: List[MemoryEntry] = []
-        self.pattern_memory: Dict[str, Any] = {}
+        # Bounded interaction log; the oldest entries are evicted past memory_cap
+        self.memory: Deque[MemoryEntry] = deque(maxlen=config.get("memory_cap", 10000))
+        # Least recently used patterns are evicted past pattern_cache_size
+        self.pattern_memory: "OrderedDict[str, Any]" = OrderedDict()
+        self._pattern_cache_size = config.get("pattern_cache_size", 1024)
         self.execution_history: List[Dict[str, Any]] = []
         self.current_session_id = datetime.now().isoformat()
         
-        # Setup logging
-        logging.basicConfig(
-            level=getattr(logging, config.get("log_level", "INFO")),
-            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-        )
+        # Entries get consecutive ids; the id of self.memory[0], and the
+        # indexed prompt tokens of each entry in memory order
+        self._first_id = 0
+        self._entry_tokens: Deque[FrozenSet[str]] = deque()
+        
+        # Running totals over the entries in memory, for get_execution_stats
+        self._confidence_sum = 0.0
+        self._execution_time_sum = 0.0
+        
+        # Inverted index of the whitespace-separated tokens of each lowercased
+        # prompt: token -> ids of the entries containing it
+        self._token_index: Dict[str, Set[int]] = defaultdict(set)
+        
+        # The distinct indexed tokens joined by newlines, rebuilt on the next
+        # query after a new token is indexed
+        self._token_text: Optional[str] = None
+        
+        # Ids of the entries in memory per agent_name, oldest first
+        self._agent_entries: Dict[str, Deque[int]] = defaultdict(deque)
+        
+        # LRU of get_relevant_memory results keyed by the query's word set,
+        # limit and agent filter, so reworded or recased repeats of a query are hits; emptied
+        # whenever memory changes
+        self._query_cache: "OrderedDict[Tuple[FrozenSet[str], int, Optional[str]], List[MemoryEntry]]" = OrderedDict()
+        self._query_cache_size = config.get("query_cache_size", 256)
+        
+        # Setup logging; basicConfig is a no-op once the root logger has handlers
+        if not logging.getLogger().handlers:
+            logging.basicConfig(
+                level=getattr(logging, config.get("log_level", "INFO")),
+                format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+            )
         self.logger = logging.getLogger("FusionContext")
         
     async def store_interaction(self, agent_name: str, input_prompt: str, 
@@ -49,7 +119,7 @@ class FusionContext:
         """Store an agent interaction in memory"""
         
         entry = MemoryEntry(
-            timestamp=datetime.now().isoformat(),
+            timestamp_ns=time.time_ns(),
             agent_name=agent_name,
             input_prompt=input_prompt,
             output=output,
@@ -59,8 +129,50 @@ class FusionContext:
             pattern_applied=pattern_applied
         )
         
+        self._append_entry(entry)
+        self.logger.info("Stored interaction for %s with confidence %s", agent_name, confidence)
+        
+    def _append_entry(self, entry: MemoryEntry) -> None:
+        """Append an entry to memory and index its prompt tokens"""
+        if len(self.memory) == self.memory.maxlen:
+            self._evict_oldest()
+        
+        self._query_cache.clear()
+        entry_id = self._first_id + len(self.memory)
+        tokens = frozenset(entry.input_prompt.lower().split())
         self.memory.append(entry)
-        self.logger.info(f"Stored interaction for {agent_name} with confidence {confidence}")
+        self._entry_tokens.append(tokens)
+        self._confidence_sum += entry.confidence
+        self._execution_time_sum += entry.execution_time
+        self._agent_entries[entry.agent_name].append(entry_id)
+        
+        token_index = self._token_index
+        for token in tokens:
+            if token not in token_index:
+                self._token_text = None
+            token_index[token].add(entry_id)
+        
+    def _evict_oldest(self) -> None:
+        """Drop the oldest entry from memory and from the token index"""
+        entry = self.memory.popleft()
+        tokens = self._entry_tokens.popleft()
+        self._confidence_sum -= entry.confidence
+        self._execution_time_sum -= entry.execution_time
+        entry_id = self._first_id
+        self._first_id += 1
+        
+        agent_ids = self._agent_entries[entry.agent_name]
+        agent_ids.popleft()
+        if not agent_ids:
+            del self._agent_entries[entry.agent_name]
+        
+        token_index = self._token_index
+        for token in tokens:
+            entry_ids = token_index[token]
+            entry_ids.discard(entry_id)
+            if not entry_ids:
+                del token_index[token]
+                self._token_text = None
         
     def get_shared_state(self, key: str, default: Any = None) -> Any:
         """Get value from shared state"""
@@ -69,31 +181,79 @@ class FusionContext:
     def set_shared_state(self, key: str, value: Any) -> None:
         """Set value in shared state"""
         self.shared_state[key] = value
-        self.logger.debug(f"Set shared state {key}: {value}")
-        
-    def get_relevant_memory(self, query: str, limit: int = 5) -> List[MemoryEntry]:
-        """Get relevant memory entries based on query similarity"""
-        # Simple keyword matching for now
-        relevant = []
-        query_lower = query.lower()
-        
-        for entry in reversed(self.memory):
-            if any(word in entry.input_prompt.lower() for word in query_lower.split()):
-                relevant.append(entry)
-                if len(relevant) >= limit:
-                    break
-                    
-        return relevant
+        self.logger.debug("Set shared state %s: %s", key, value)
+        
+    def get_relevant_memory(self, query: str, limit: int = 5,
+                            agent_filter: Optional[str] = None) -> List[MemoryEntry]:
+        """Get relevant memory entries based on query similarity, optionally
+        only those stored by the agent named agent_filter"""
+        # Simple keyword matching for now: an entry matches when any query word
+        # occurs in its lowercased prompt. Query words contain no whitespace, so
+        # that is exactly when a word occurs inside one of the indexed tokens
+        words = frozenset(query.lower().split())
+        if not words:
+            return []
+        
+        limit = max(limit, 1)
+        key = (words, limit, agent_filter)
+        cached = self._query_cache.get(key)
+        if cached is not None:
+            self._query_cache.move_to_end(key)
+            return list(cached)
+        
+        if agent_filter is not None and agent_filter not in self._agent_entries:
+            return []
+        
+        token_text = self._token_text
+        if token_text is None:
+            token_text = self._token_text = "\n".join(self._token_index)
+        
+        # One pass of a compiled alternation of the query words over all tokens;
+        # a match never spans a newline, and each matching token is taken once
+        search = re.compile("|".join(map(re.escape, words))).search
+        entry_ids: Set[int] = set()
+        match = search(token_text)
+        while match:
+            start = token_text.rfind("\n", 0, match.start()) + 1
+            end = token_text.find("\n", match.end())
+            if end < 0:
+                end = len(token_text)
+            entry_ids |= self._token_index[token_text[start:end]]
+            match = search(token_text, end)
+        
+        # Most recent first; like the old scan, at least one match is returned
+        if agent_filter is None:
+            top_ids = heapq.nlargest(limit, entry_ids)
+        else:
+            # Walk the agent's own entries newest first, keeping keyword matches
+            agent_ids = reversed(self._agent_entries[agent_filter])
+            top_ids = list(islice((entry_id for entry_id in agent_ids if entry_id in entry_ids), limit))
+        first_id = self._first_id
+        relevant = [self.memory[entry_id - first_id] for entry_id in top_ids]
+        
+        if self._query_cache_size > 0:
+            self._query_cache[key] = relevant
+            if len(self._query_cache) > self._query_cache_size:
+                self._query_cache.popitem(last=False)
+        return list(relevant)
         
     def get_pattern_memory(self, pattern_name: str) -> Dict[str, Any]:
         """Get pattern memory for a specific pattern"""
-        return self.pattern_memory.get(pattern_name, {})
+        if pattern_name not in self.pattern_memory:
+            return {}
+        self.pattern_memory.move_to_end(pattern_name)
+        return self.pattern_memory[pattern_name]
         
     def store_pattern_memory(self, pattern_name: str, data: Dict[str, Any]) -> None:
         """Store pattern-specific memory"""
-        if pattern_name not in self.pattern_memory:
-            self.pattern_memory[pattern_name] = {}
-        self.pattern_memory[pattern_name].update(data)
+        self.pattern_memory.setdefault(pattern_name, {}).update(data)
+        self.pattern_memory.move_to_end(pattern_name)
+        self._trim_pattern_memory()
+        
+    def _trim_pattern_memory(self) -> None:
+        """Evict least recently used patterns beyond pattern_cache_size"""
+        while len(self.pattern_memory) > self._pattern_cache_size:
+            self.pattern_memory.popitem(last=False)
         
     def get_execution_stats(self) -> Dict[str, Any]:
         """Get execution statistics"""
@@ -101,8 +261,8 @@ class FusionContext:
             return {"total_interactions": 0, "avg_confidence": 0.0}
             
         total_interactions = len(self.memory)
-        avg_confidence = sum(entry.confidence for entry in self.memory) / total_interactions
-        avg_execution_time = sum(entry.execution_time for entry in self.memory) / total_interactions
+        avg_confidence = self._confidence_sum / total_interactions
+        avg_execution_time = self._execution_time_sum / total_interactions
         
         return {
             "total_interactions": total_interactions,
@@ -115,23 +275,39 @@ class FusionContext:
     def clear_memory(self) -> None:
         """Clear all memory (use with caution)"""
         self.memory.clear()
+        self._entry_tokens.clear()
+        self._first_id = 0
+        self._confidence_sum = 0.0
+        self._execution_time_sum = 0.0
+        self._token_index.clear()
+        self._token_text = None
+        self._agent_entries.clear()
+        self._query_cache.clear()
         self.pattern_memory.clear()
         self.shared_state.clear()
         self.logger.info("Memory cleared")
         
     def export_memory(self, filepath: str) -> None:
         """Export memory to JSON file"""
-        memory_data = {
-            "session_id": self.current_session_id,
-            "memory": [asdict(entry) for entry in self.memory],
-            "pattern_memory": self.pattern_memory,
-            "shared_state": self.shared_state
-        }
-        
+        # Written piece by piece with the same layout json.dump(..., indent=2)
+        # produces, so only one entry is converted to a dict at a time
         with open(filepath, 'w') as f:
-            json.dump(memory_data, f, indent=2)
+            f.write('{\n  "session_id": ')
+            f.write(json.dumps(self.current_session_id))
+            f.write(',\n  "memory": [')
+            separator = "\n    "
+            for entry in self.memory:
+                f.write(separator)
+                f.write(_nest_json(json.dumps(entry.to_dict(), indent=2, default=dict), 2))
+                separator = ",\n    "
+            f.write("\n  ]" if self.memory else "]")
+            f.write(',\n  "pattern_memory": ')
+            f.write(_nest_json(json.dumps(self.pattern_memory, indent=2), 1))
+            f.write(',\n  "shared_state": ')
+            f.write(_nest_json(json.dumps(self.shared_state, indent=2), 1))
+            f.write("\n}")
             
-        self.logger.info(f"Memory exported to {filepath}")
+        self.logger.info("Memory exported to %s", filepath)
         
     def import_memory(self, filepath: str) -> None:
         """Import memory from JSON file"""
@@ -139,28 +315,36 @@ class FusionContext:
             with open(filepath, 'r') as f:
                 memory_data = json.load(f)
                 
-            # Import memory entries
-            for entry_data in memory_data.get("memory", []):
-                entry = MemoryEntry(**entry_data)
-                self.memory.append(entry)
+            # Import memory entries. Entries past memory_cap would only be
+            # evicted again, and the rest are released from the parsed list
+            # as they are converted
+            entries = memory_data.pop("memory", [])
+            cap = self.memory.maxlen
+            if cap is not None and len(entries) > cap:
+                del entries[:len(entries) - cap]
+            entries.reverse()
+            while entries:
+                entry = MemoryEntry.from_dict(entries.pop())
+                self._append_entry(entry)
                 
             # Import pattern memory
             self.pattern_memory.update(memory_data.get("pattern_memory", {}))
+            self._trim_pattern_memory()
             
             # Import shared state
             self.shared_state.update(memory_data.get("shared_state", {}))
             
-            self.logger.info(f"Memory imported from {filepath}")
+            self.logger.info("Memory imported from %s", filepath)
             
         except Exception as e:
-            self.logger.error(f"Failed to import memory: {e}")
+            self.logger.error("Failed to import memory: %s", e)
             
     def get_context_summary(self) -> str:
         """Get a summary of current context"""
         stats = self.get_execution_stats()
-        recent_memory = self.memory[-5:] if self.memory else []
+        recent_memory = list(islice(reversed(self.memory), 5))[::-1]
         
-        summary = f"""
+        parts = [f"""
 Fusion v14 Context Summary:
 - Session ID: {self.current_session_id}
 - Total Interactions: {stats['total_interactions']}
@@ -170,9 +354,10 @@ Fusion v14 Context Summary:
 - Pattern Memory Keys: {list(self.pattern_memory.keys())}
 
 Recent Interactions:
-"""
-        
-        for entry in recent_memory:
-            summary += f"- {entry.agent_name}: {entry.input_prompt[:50]}... (confidence: {entry.confidence:.2f})\n"
+"""]
+        parts.extend(
+            f"- {entry.agent_name}: {entry.input_prompt[:50]}... (confidence: {entry.confidence:.2f})\n"
+            for entry in recent_memory
+        )
             
-        return summary 
\ No newline at end of file
+        return "".join(parts) 
\ No newline at end of file
@@ -6,18 +6,40 @@ Programmable agent OS for design and evaluation
 
 import argparse
 import asyncio
+import importlib
 import sys
 
-from agents.vp_design_agent import VPDesignAgent
-from agents.evaluator_agent import EvaluatorAgent
-from agents.creative_director_agent import CreativeDirectorAgent
-from agents.prompt_master_agent import PromptMasterAgent
-from agents.design_technologist_agent import DesignTechnologistAgent
-from agents.product_navigator_agent import ProductNavigatorAgent
-from core.execution_orchestrator_v14 import ExecutionOrchestrator
+from core.event_loop import install_uvloop
+
+# Working agents: name -> (module, class); resolved only when selected
+AGENT_REGISTRY = {
+    "vp_design": ("agents.vp_design_agent", "VPDesignAgent"),
+    "evaluator": ("agents.evaluator_agent", "EvaluatorAgent"),
+    "creative_director": ("agents.creative_director_agent", "CreativeDirectorAgent"),
+    "prompt_master": ("agents.prompt_master_agent", "PromptMasterAgent"),
+    "design_technologist": ("agents.design_technologist_agent", "DesignTechnologistAgent"),
+    "product_navigator": ("agents.product_navigator_agent", "ProductNavigatorAgent"),
+}
+
+# Placeholder agents (need implementation)
+PLACEHOLDER_AGENTS = ("strategy_pilot", "vp_of_design", "vp_of_product")
 
 print("🧠 DEBUG: fusion.py top-level code executed")
 
+async def _with_eager_tasks(coro):
+    """Await coro with the eager task factory installed (Python 3.12+) so
+    tasks that finish without suspending skip the event loop round-trip"""
+    eager_task_factory = getattr(asyncio, "eager_task_factory", None)
+    if eager_task_factory is not None:
+        asyncio.get_running_loop().set_task_factory(eager_task_factory)
+    return await coro
+
+def _load_agent(name):
+    """Import the selected agent's module on first use and return its class"""
+    mod_name, cls_name = AGENT_REGISTRY[name]
+    mod = sys.modules.get(mod_name) or importlib.import_module(mod_name)
+    return getattr(mod, cls_name)
+
 def main():
     parser = argparse.ArgumentParser(description="Fusion v14 CLI")
     subparsers = parser.add_subparsers(dest="command")
@@ -35,6 +57,8 @@ def main():
     args = parser.parse_args()
     print(f"🛠 DEBUG: Parsed args = {args}")
 
+    install_uvloop()
+
     if args.command == "run":
         if not args.input:
             print("❌ Error: 'run' command requires input")
@@ -43,35 +67,19 @@ def main():
         input_text = " ".join(args.input)
         print(f"�� Running agent '{args.agent}' on input: {input_text}")
 
-        # Dynamic agent loading
-        agent_map = {
-            "vp_design": VPDesignAgent,
-            "evaluator": EvaluatorAgent,
-            "creative_director": CreativeDirectorAgent,
-            "prompt_master": PromptMasterAgent,
-            "design_technologist": DesignTechnologistAgent,
-            "product_navigator": ProductNavigatorAgent,
-            "strategy_pilot": "StrategyPilotAgent",  # Placeholder
-            "vp_of_design": "VPOfDesignAgent",  # Placeholder
-            "vp_of_product": "VPOfProductAgent"  # Placeholder
-        }
-        
-        if args.agent in agent_map:
-            if args.agent in ["vp_design", "evaluator", "creative_director", "prompt_master", "design_technologist", "product_navigator"]:
-                # Working agents
-                agent_class = agent_map[args.agent]
-                agent = agent_class()
-                output = asyncio.run(agent.run_async(input_text, {}))
-                print(f"🎨 Output from {args.agent}:\n{output}")
-            else:
-                # Placeholder agents (need implementation)
-                print(f"⚠️ Agent '{args.agent}' is available but not yet implemented")
-                print(f"Available working agents: vp_design, evaluator, creative_director, prompt_master, design_technologist, product_navigator")
-                print(f"Available placeholder agents: {', '.join([k for k in agent_map.keys() if k not in ['vp_design', 'evaluator']])}")
-                sys.exit(1)
+        if args.agent in AGENT_REGISTRY:
+            agent_class = _load_agent(args.agent)
+            agent = agent_class()
+            output = asyncio.run(_with_eager_tasks(agent.run_async(input_text, {})))
+            print(f"🎨 Output from {args.agent}:\n{output}")
+        elif args.agent in PLACEHOLDER_AGENTS:
+            print(f"⚠️ Agent '{args.agent}' is available but not yet implemented")
+            print(f"Available working agents: {', '.join(AGENT_REGISTRY)}")
+            print(f"Available placeholder agents: {', '.join([k for k in (*AGENT_REGISTRY, *PLACEHOLDER_AGENTS) if k not in ['vp_design', 'evaluator']])}")
+            sys.exit(1)
         else:
             print(f"❌ Error: Unknown agent '{args.agent}'")
-            print(f"Available agents: {', '.join(agent_map.keys())}")
+            print(f"Available agents: {', '.join((*AGENT_REGISTRY, *PLACEHOLDER_AGENTS))}")
             sys.exit(1)
 
     elif args.command == "pipeline":
@@ -82,6 +90,9 @@ def main():
         input_text = " ".join(args.input)
         print(f"⚙️ Running pipeline on: {input_text}")
 
+        from agents.vp_design_agent import VPDesignAgent
+        from agents.evaluator_agent import EvaluatorAgent
+        from core.execution_orchestrator_v14 import ExecutionOrchestrator
         from core.fusion_context import FusionContext
         context = FusionContext({})
         orchestrator = ExecutionOrchestrator(context)
@@ -102,7 +113,7 @@ def main():
         print(f"✅ Registered tools: ux_audit, trust_explainer")
         print(f"📋 Available agents (not yet implemented): creative_director, prompt_master, design_technologist, product_navigator, strategy_pilot, vp_of_design, vp_of_product")
         
-        output = asyncio.run(orchestrator.execute_pipeline(input_text))
+        output = asyncio.run(_with_eager_tasks(orchestrator.execute_pipeline(input_text)))
         print(f"🧩 Pipeline Output:\n{output}")
 
     else:
@@ -14,6 +14,7 @@ from typing import Dict, Any, Optional
 # Import Fusion v14 components
 from core.fusion_context import FusionContext
 from core.execution_orchestrator_v14 import ExecutionOrchestrator
+from core.event_loop import install_uvloop
 from agents.vp_design_agent import VPDesignAgent
 from agents.evaluator_agent import EvaluatorAgent
 from tools.ux_audit_tool import UXAuditTool
@@ -309,6 +310,7 @@ def main():
     """Main entry point"""
     
     try:
+        install_uvloop()
         cli = FusionCLI()
         asyncio.run(cli.main())
     except KeyboardInterrupt:
@@ -2,16 +2,25 @@
 Creative Director Patterns – Rewrite and critique logic
 """
 
+import re
+
+_CRITIQUE_REWRITES = {"too verbose": "concise", "unclear": "sharp and direct"}
+_CRITIQUE_RE = re.compile("|".join(map(re.escape, _CRITIQUE_REWRITES)))
+_VALUE_RE = re.compile("value", re.IGNORECASE)
+
+def _rewrite_critique(match):
+    return _CRITIQUE_REWRITES[match.group(0)]
+
 def apply_creative_critique(input_prompt, output):
     feedback = []
     score_lift = 0.1
-    enhanced = output
 
-    if "too verbose" in output or "unclear" in output:
+    # One pass both detects and rewrites the critique phrases
+    enhanced, hits = _CRITIQUE_RE.subn(_rewrite_critique, output)
+    if hits:
         feedback.append("Output is unclear or verbose. Needs more punch.")
-        enhanced = output.replace("too verbose", "concise").replace("unclear", "sharp and direct")
         score_lift = 0.2
-    if "value" not in output.lower():
+    if _VALUE_RE.search(output) is None:
         feedback.append("Missing clear value proposition.")
         enhanced += " → Refocus on the outcome or benefit."
 
@@ -4,20 +4,51 @@ PatternMatcher (Fusion v13)
 Detects matching patterns based on keywords and quality metrics
 """
 
+import re
+from functools import lru_cache
 from typing import Dict, Any, Optional, List
 from patterns.pattern_registry import PATTERNS
 
+def _compile_triggers(patterns: Dict[str, Dict[str, Any]]):
+    """One zero-width scan over every pattern's triggers, a named group per
+    pattern in registry order, so each position reports the earliest pattern
+    with a trigger starting there"""
+    keys = []
+    groups = []
+    for key, pattern in patterns.items():
+        triggers = pattern.get("triggers", [])
+        if not triggers:
+            continue
+        alternation = "|".join(re.escape(t) for t in sorted(triggers, key=len, reverse=True))
+        groups.append(f"(?P<p{len(keys)}>{alternation})")
+        keys.append(key)
+    if not groups:
+        return None, keys
+    return re.compile("(?=" + "|".join(groups) + ")"), keys
+
+# PATTERNS is static, so the scan is compiled once per process rather than per matcher
+_TRIGGER_RE, _TRIGGER_KEYS = _compile_triggers(PATTERNS)
+
+@lru_cache(maxsize=1024)
+def _match_lowered(lowered: str) -> Optional[str]:
+    """First pattern in registry order with a trigger in the lowercased prompt"""
+    if _TRIGGER_RE is None:
+        return None
+    best = None
+    for m in _TRIGGER_RE.finditer(lowered):
+        index = m.lastindex - 1
+        if best is None or index < best:
+            best = index
+            if best == 0:
+                break
+    return None if best is None else _TRIGGER_KEYS[best]
+
 class PatternMatcher:
     def __init__(self):
         self.patterns = PATTERNS
 
     def match_by_keywords(self, prompt: str) -> Optional[str]:
-        prompt = prompt.lower()
-        for key, pattern in self.patterns.items():
-            triggers = pattern.get("triggers", [])
-            if any(trigger in prompt for trigger in triggers):
-                return key
-        return None
+        return _match_lowered(prompt.lower())
 
     def match_by_quality(self, quality_metrics: Dict[str, float], overall_score: float) -> Optional[str]:
         if overall_score < 0.8:
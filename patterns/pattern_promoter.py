@@ -18,36 +18,36 @@ class PatternPromoter:
         """
         Analyze memory entries and promote high-quality outputs into reusable patterns.
         """
+        threshold = self.threshold
+        # Every pattern promoted in one pass shares the same promotion instant
+        promoted_at = datetime.now().isoformat()
         promoted = []
-        
+
         for run in memory:
             # Extract quality metrics
             result = run.get("result", {})
             overall_score = result.get("overall_score", 0)
-            quality_metrics = result.get("quality_metrics", {})
-            
+
             # Check if this run meets promotion threshold
-            if overall_score >= self.threshold:
+            if overall_score >= threshold:
                 prompt = run.get("input", "").strip()
                 code_output = result.get("code", {}).get("output", "").strip()
-                
+
                 if prompt and code_output:
-                    pattern_name = f"auto_promoted_{len(promoted)+1}"
-                    pattern = {
-                        "name": pattern_name,
+                    promoted.append({
+                        "name": f"auto_promoted_{len(promoted)+1}",
                         "source_prompt": prompt,
                         "generated_code": code_output,
                         "score": overall_score,
-                        "quality_metrics": quality_metrics,
-                        "timestamp": datetime.now().isoformat(),
+                        "quality_metrics": result.get("quality_metrics", {}),
+                        "timestamp": promoted_at,
                         "original_run": run
-                    }
-                    promoted.append(pattern)
-        
+                    })
+
         # Write promoted patterns to library
         if promoted:
             self._write_patterns(promoted)
-        
+
         return promoted
 
     def analyze_memory_quality(self, memory: List[Dict[str, Any]]) -> Dict[str, Any]:
@@ -56,31 +56,31 @@ class PatternPromoter:
         """
         if not memory:
             return {"total_runs": 0, "promotable_runs": 0, "avg_score": 0}
-        
+
+        threshold = self.threshold
         total_runs = len(memory)
-        promotable_runs = 0
         total_score = 0
         high_quality_runs = []
-        
+
         for run in memory:
-            result = run.get("result", {})
+            get = run.get
+            result = get("result", {})
             score = result.get("overall_score", 0)
             total_score += score
-            
-            if score >= self.threshold:
-                promotable_runs += 1
+
+            if score >= threshold:
                 high_quality_runs.append({
-                    "prompt": run.get("input", ""),
+                    "prompt": get("input", ""),
                     "score": score,
-                    "timestamp": run.get("timestamp", "")
+                    "timestamp": get("timestamp", "")
                 })
-        
-        avg_score = total_score / total_runs if total_runs > 0 else 0
-        
+
+        promotable_runs = len(high_quality_runs)
+
         return {
             "total_runs": total_runs,
             "promotable_runs": promotable_runs,
-            "avg_score": avg_score,
-            "promotion_rate": promotable_runs / total_runs if total_runs > 0 else 0,
+            "avg_score": total_score / total_runs,
+            "promotion_rate": promotable_runs / total_runs,
             "high_quality_runs": high_quality_runs
         }